@@ -18,6 +18,7 @@ Options:
     --help             Show this help message
 """
 
+import logging
 import sys
 import os
 import argparse
@@ -90,20 +91,68 @@ def run_database_setup(drop_existing=False):
         return False
 
 
+def run_schema_upgrade():
+    """Upgrade an existing database built by an earlier version."""
+    try:
+        from src.database.db_setup import DatabaseManager
+
+        DatabaseManager().upgrade_database()
+        return True
+
+    except Exception as e:
+        print(f"\n❌ Error while upgrading the database schema: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def is_reloader_process():
+    """Check if this is the process started by the Werkzeug reloader."""
+    return os.environ.get('WERKZEUG_RUN_MAIN') == 'true'
+
+
+def get_reloader_options():
+    """
+    Get Werkzeug reloader settings for the development server.
+
+    Uses the watchdog reloader (file system events) when it is installed,
+    and keeps installed packages out of the files the reloader watches.
+    """
+    try:
+        import watchdog  # noqa: F401
+        reloader_type = 'watchdog'
+    except ImportError:
+        reloader_type = 'stat'
+
+    return {
+        'reloader_type': reloader_type,
+        'extra_files': [],
+        'exclude_patterns': sorted({
+            os.path.join(sys.prefix, '*'),
+            os.path.join(sys.base_prefix, '*')
+        })
+    }
+
+
 def run_flask_app(port=5000):
     """Run Flask web application."""
-    print_step(3, 3, "STARTING WEB APPLICATION")
+    # The reloader process only needs to serve; setup output was already shown
+    reloader_process = is_reloader_process()
+
+    if not reloader_process:
+        print_step(3, 3, "STARTING WEB APPLICATION")
 
     try:
         from src.api.app import app
 
-        print(f"\n🎬 Starting Streamly Recommendation System...")
-        print(f"\n📍 Frontend: http://localhost:{port}")
-        print(f"📍 API: http://localhost:{port}/api")
-        print(f"\nPress CTRL+C to stop the server")
-        print("=" * 80 + "\n")
+        if not reloader_process:
+            print(f"\n🎬 Starting Streamly Recommendation System...")
+            print(f"\n📍 Frontend: http://localhost:{port}")
+            print(f"📍 API: http://localhost:{port}/api")
+            print(f"\nPress CTRL+C to stop the server")
+            print("=" * 80 + "\n")
 
-        app.run(debug=True, host='0.0.0.0', port=port)
+        app.run(debug=True, host='0.0.0.0', port=port, **get_reloader_options())
 
     except KeyboardInterrupt:
         print("\n\n🛑 Server stopped by user")
@@ -135,8 +184,11 @@ def check_data_files():
 
 def main():
     """Main workflow execution."""
+    # The pipeline modules report progress through logging
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+
     # Check if this is a Flask reloader restart
-    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+    if is_reloader_process():
         # This is the reloader process, skip all setup and just run the app
         run_flask_app(port=5000)
         return
@@ -207,6 +259,9 @@ def main():
             sys.exit(1)
     else:
         print("\n⏭️  Skipping database setup (using existing database)")
+        if db_path.exists() and not run_schema_upgrade():
+            print("\n❌ Workflow failed at database upgrade step.")
+            sys.exit(1)
 
     # Step 3: Run Flask App
     print_banner("✅ SETUP COMPLETE - STARTING APPLICATION")
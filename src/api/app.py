@@ -6,35 +6,324 @@ IMPROVED VERSION: Added advanced filtering, pagination, and combined endpoints.
 """
 
 import sys
+import gzip
+import json
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from flask import Flask, jsonify, request, render_template
+from flask import Flask, Response, request, render_template
 from flask_cors import CORS
 from datetime import datetime
-from sqlalchemy import and_, or_, desc, asc
+from sqlalchemy import and_, or_, desc, asc, func, select, bindparam
 
-from src.recommendation.engine import RecommendationEngine
-from src.database.queries import DatabaseQueries
-from src.database.models import Title
+from src.database.models import Profile, Title
+from src.database.cache import TTLCache, get_data_version
+
+# orjson is optional; fall back to the standard library encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Initialize Flask app
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend access
 
-# Initialize services
-recommendation_engine = RecommendationEngine()
-db_queries = DatabaseQueries()
+# Services are created on first use, so importing the app (e.g. on every
+# reloader restart) doesn't pay for building the recommendation engine
+_db_queries = None
+_recommendation_engine = None
+
+
+def get_db_queries():
+    """Get the shared DatabaseQueries instance, creating it on first use."""
+    global _db_queries
+    if _db_queries is None:
+        from src.database.queries import DatabaseQueries
+        _db_queries = DatabaseQueries()
+    return _db_queries
+
+
+def get_recommendation_engine():
+    """Get the shared RecommendationEngine instance, creating it on first use."""
+    global _recommendation_engine
+    if _recommendation_engine is None:
+        from src.recommendation.engine import RecommendationEngine
+        _recommendation_engine = RecommendationEngine()
+    return _recommendation_engine
+
+
+def encode_json(payload):
+    """Serialize a payload to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def json_response(payload, status=200):
+    """
+    Build a JSON response.
+
+    Args:
+        payload: JSON-serializable object
+        status: HTTP status code
+
+    Returns:
+        Flask Response with an application/json body
+    """
+    return Response(encode_json(payload), status=status, mimetype='application/json')
+
+
+# Responses that only change when the database is rebuilt may be reused by
+# clients for a short while, then revalidated with their ETag
+CACHE_CONTROL = 'public, max-age=60, stale-while-revalidate=300'
+
+
+def compute_etag(body):
+    """Get a cheap ETag (CRC32) for a serialized response body."""
+    return format(zlib.crc32(body), '08x')
+
+
+def cacheable_json_response(body, etag=None):
+    """
+    Build a JSON response with an ETag and Cache-Control header.
+
+    Answers 304 Not Modified when the client's If-None-Match matches.
+
+    Args:
+        body: Serialized JSON bytes
+        etag: Precomputed ETag (computed from the body if omitted)
+
+    Returns:
+        Flask Response
+    """
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag or compute_etag(body))
+    response.headers['Cache-Control'] = CACHE_CONTROL
+    return response.make_conditional(request)
+
+
+# Bodies smaller than this aren't worth compressing
+GZIP_MIN_SIZE = 512
+# Fastest level; list payloads are repetitive and compress well even at 1
+GZIP_LEVEL = 1
+
+
+def encode_json_body(payload):
+    """
+    Serialize a payload once, keeping a gzip-compressed copy if it is large.
+
+    Args:
+        payload: JSON-serializable object
+
+    Returns:
+        Dict with the raw 'body' bytes and 'gzip' bytes (None if not compressed)
+    """
+    body = encode_json(payload)
+    compressed = None
+    if len(body) >= GZIP_MIN_SIZE:
+        compressed = gzip.compress(body, compresslevel=GZIP_LEVEL)
+    return {'body': body, 'gzip': compressed}
+
+
+def encoded_json_response(encoded, status=200):
+    """
+    Build a JSON response from encode_json_body() output.
+
+    The gzip copy is sent when the client accepts gzip encoding.
+
+    Args:
+        encoded: Dict returned by encode_json_body()
+        status: HTTP status code
+
+    Returns:
+        Flask Response with an application/json body
+    """
+    if encoded['gzip'] is not None and request.accept_encodings['gzip']:
+        response = Response(encoded['gzip'], status=status, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(encoded['body'], status=status, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+# Columns returned by the title list endpoints
+TITLE_LIST_COLUMNS = (
+    Title.show_id,
+    Title.title_name,
+    Title.category,
+    Title.sub_category,
+    Title.year,
+    Title.type,
+    Title.duration,
+    Title.age_rating,
+    Title.language,
+    Title.imdb_rating,
+    Title.imdb_votes,
+    Title.is_kids_content
+)
+
+# Worker threads for running independent database reads concurrently
+# (each thread gets its own scoped session; WAL lets the readers overlap)
+_DB_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Seconds catalog-derived caches (categories, title dicts, title count) are
+# kept; the catalog only changes when the database is rebuilt
+CATALOG_CACHE_TTL = 300
+
+# Sorted category list and its serialized response body. Each rebuild
+# stores a new snapshot rather than updating this one, so a reader always
+# gets a body and ETag from the same rebuild.
+_CATEGORIES_CACHE = None
+
+
+def _get_categories_cache():
+    """
+    Get the cached category list, rebuilding it if stale.
+
+    Returns:
+        Snapshot with the sorted category tuple, serialized JSON body and ETag
+    """
+    global _CATEGORIES_CACHE
+
+    snapshot = _CATEGORIES_CACHE
+    if (
+        snapshot is None
+        or time.time() - snapshot['ts'] >= CATALOG_CACHE_TTL
+        or snapshot['version'] != get_data_version()
+    ):
+        version = get_data_version()
+        with get_db_queries().session_scope() as session:
+            categories = session.query(Title.category).distinct().all()
+            categories_list = tuple(sorted(c[0] for c in categories if c[0] and c[0] != 'Unknown'))
+
+        body = encode_json({
+            'status': 'success',
+            'data': categories_list,
+            'count': len(categories_list)
+        })
+        snapshot = {
+            'value': categories_list,
+            'body': body,
+            'etag': compute_etag(body),
+            'ts': time.time(),
+            'version': version
+        }
+        _CATEGORIES_CACHE = snapshot
+
+    return snapshot
+
+
+def _all_categories():
+    """Get the sorted list of known categories (cached)."""
+    return _get_categories_cache()['value']
+
+
+# Recommendations only change when the data is reloaded
+_RECOMMENDATIONS_CACHE = TTLCache(maxsize=4096, ttl=600)
+_CATEGORY_RECOMMENDATIONS_CACHE = TTLCache(maxsize=4096, ttl=600)
+
+# Encoded /api/titles/filter responses, keyed by the canonical query string
+_FILTER_CACHE = TTLCache(maxsize=512, ttl=300)
+
+# /api/titles/filter conditions; values are bound at execution time
+TITLE_FILTERS = {
+    'category': Title.category == bindparam('category'),
+    'type': Title.type == bindparam('type'),
+    'kids_content': Title.is_kids_content == True,
+    'age_rating': Title.age_rating == bindparam('age_rating'),
+    'year_min': Title.year >= bindparam('year_min'),
+    'year_max': Title.year <= bindparam('year_max'),
+    'min_rating': Title.imdb_rating >= bindparam('min_rating'),
+    'language': Title.language == bindparam('language')
+}
+
+
+@lru_cache(maxsize=256)
+def _build_filter_stmt(filters, sort_by, order):
+    """
+    Build the /api/titles/filter statement for a combination of filters.
+
+    Filter values and the limit are bound parameters, so one statement
+    (and its SQL compilation) is reused by every request that uses the
+    same filters and sorting.
+
+    Args:
+        filters: Tuple of TITLE_FILTERS keys
+        sort_by: Title column to sort by
+        order: 'asc' or 'desc'
+
+    Returns:
+        Select statement
+    """
+    stmt = select(*TITLE_LIST_COLUMNS)
+    for name in filters:
+        stmt = stmt.where(TITLE_FILTERS[name])
+
+    # Apply sorting (show_id breaks ties so results are stable)
+    sort_column = getattr(Title, sort_by)
+    if order == 'asc':
+        stmt = stmt.order_by(asc(sort_column), Title.show_id)
+    else:
+        stmt = stmt.order_by(desc(sort_column), Title.show_id)
+
+    return stmt.limit(bindparam('limit'))
+
+
+# Total title count for page/offset pagination, refreshed like the categories
+_TITLES_TOTAL = {'value': None, 'ts': 0, 'version': None}
+
+
+# API representation (Title.to_dict()) of every title, keyed by show_id.
+# The catalog only changes on a rebuild, so the dicts are built once and
+# reused instead of reading ORM attributes on every request.
+_TITLE_DICTS = {'value': None, 'ts': 0, 'version': None}
+TITLE_LOAD_BATCH_SIZE = 1000
+
+
+def _get_title_dicts():
+    """Get the title dicts by show_id, reloading them when stale."""
+    if (
+        _TITLE_DICTS['value'] is None
+        or time.time() - _TITLE_DICTS['ts'] >= CATALOG_CACHE_TTL
+        or _TITLE_DICTS['version'] != get_data_version()
+    ):
+        with get_db_queries().session_scope() as session:
+            # Converted batch by batch, so the Title objects don't all stay alive
+            title_dicts = {
+                t.show_id: t.to_dict()
+                for t in session.query(Title).yield_per(TITLE_LOAD_BATCH_SIZE)
+            }
+
+        _TITLE_DICTS.update({
+            'value': title_dicts,
+            'ts': time.time(),
+            'version': get_data_version()
+        })
+
+    return _TITLE_DICTS['value']
+
+
+@app.teardown_appcontext
+def remove_session(exception=None):
+    """Release the thread-local database session at the end of a request."""
+    if _db_queries is not None:
+        _db_queries.remove_session()
 
 
 # Error handlers
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
-    return jsonify({
+    return json_response({
         'error': 'Not Found',
         'message': 'The requested resource was not found',
         'status': 404
@@ -44,7 +333,7 @@ def not_found(error):
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    return jsonify({
+    return json_response({
         'error': 'Internal Server Error',
         'message': 'An internal error occurred',
         'status': 500
@@ -72,7 +361,7 @@ def health_check():
     Returns:
         JSON response with API status
     """
-    return jsonify({
+    return json_response({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
         'version': '1.0.0'
@@ -89,13 +378,13 @@ def get_statistics():
         JSON response with database statistics
     """
     try:
-        stats = db_queries.get_statistics()
-        return jsonify({
+        stats = get_db_queries().get_statistics()
+        return cacheable_json_response(encode_json({
             'status': 'success',
             'data': stats
-        })
+        }))
     except Exception as e:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': str(e)
         }), 500
@@ -114,15 +403,15 @@ def get_profile(profile_id):
         JSON response with profile data
     """
     try:
-        profile = db_queries.get_profile_by_id(profile_id)
+        profile = get_db_queries().get_profile_by_id(profile_id)
 
         if not profile:
-            return jsonify({
+            return json_response({
                 'status': 'error',
                 'message': f'Profile {profile_id} not found'
             }), 404
 
-        return jsonify({
+        return json_response({
             'status': 'success',
             'data': {
                 'profile_id': profile.profile_id,
@@ -135,7 +424,7 @@ def get_profile(profile_id):
             }
         })
     except Exception as e:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': str(e)
         }), 500
@@ -153,7 +442,7 @@ def get_account_profiles(account_id):
         JSON response with list of profiles
     """
     try:
-        profiles = db_queries.get_profiles_by_account(account_id)
+        profiles = get_db_queries().get_profiles_by_account(account_id)
 
         profiles_data = [{
             'profile_id': p.profile_id,
@@ -163,13 +452,13 @@ def get_account_profiles(account_id):
             'preferred_language': p.preferred_language
         } for p in profiles]
 
-        return jsonify({
+        return json_response({
             'status': 'success',
             'data': profiles_data,
             'count': len(profiles_data)
         })
     except Exception as e:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': str(e)
         }), 500
@@ -184,28 +473,25 @@ def get_all_profiles():
         JSON response with all profiles
     """
     try:
-        session = db_queries.get_session()
-        try:
-            from src.database.models import Profile
-            profiles = session.query(Profile).order_by(Profile.profile_id).all()
-
-            profiles_data = [{
-                'profile_id': p.profile_id,
-                'profile_name': p.profile_name,
-                'kids_profile': p.kids_profile,
-                'age_band': p.age_band,
-                'account_id': p.account_id
-            } for p in profiles]
-
-            return jsonify({
+        with get_db_queries().session_scope() as session:
+            rows = session.execute(
+                select(
+                    Profile.profile_id,
+                    Profile.profile_name,
+                    Profile.kids_profile,
+                    Profile.age_band,
+                    Profile.account_id
+                ).order_by(Profile.profile_id)
+            ).mappings().all()
+            profiles_data = [dict(row) for row in rows]
+
+            return cacheable_json_response(encode_json({
                 'status': 'success',
                 'data': profiles_data,
                 'count': len(profiles_data)
-            })
-        finally:
-            session.close()
+            }))
     except Exception as e:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': str(e)
         }), 500
@@ -233,41 +519,80 @@ def get_recommendations(profile_id):
         limit = min(limit, 50)  # Cap at 50
 
         exclude_param = request.args.get('exclude', default='', type=str)
-        exclude_show_ids = [s.strip() for s in exclude_param.split(',') if s.strip()]
+        exclude_show_ids = _parse_exclude(exclude_param)
 
-        # Get recommendations
-        recommendations = recommendation_engine.get_recommendations(
+        # Get recommendations (served from cache when possible)
+        cached = _get_cached_recommendations(profile_id, limit, exclude_show_ids)
+        return Response(cached['body'], mimetype='application/json')
+    except Exception as e:
+        return json_response({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@lru_cache(maxsize=1024)
+def _parse_exclude(exclude_param):
+    """Parse a comma-separated exclude parameter into a set of show IDs."""
+    return frozenset(s.strip() for s in exclude_param.split(',') if s.strip())
+
+
+def _get_cached_recommendations(profile_id, limit, exclude_show_ids=None):
+    """
+    Get formatted recommendations along with the serialized endpoint response.
+
+    Results are cached per (profile_id, limit, excluded show IDs) until the
+    TTL expires or the data is reloaded.
+
+    Args:
+        profile_id: Profile ID
+        limit: Number of recommendations
+        exclude_show_ids: Show IDs to exclude
+
+    Returns:
+        Dict with the formatted recommendations ('data') and JSON body ('body')
+    """
+    exclude_key = frozenset(exclude_show_ids or ())
+    cache_key = (profile_id, limit, exclude_key)
+
+    cached = _RECOMMENDATIONS_CACHE.get(cache_key)
+    if cached is None:
+        recommendations = get_recommendation_engine().get_recommendations(
             profile_id=profile_id,
             limit=limit,
-            exclude_show_ids=exclude_show_ids if exclude_show_ids else None
+            exclude_show_ids=exclude_key or None
         )
+        recs_data = [_format_recommendation(rec) for rec in recommendations]
 
-        # Format response
-        recs_data = [{
-            'show_id': rec['show_id'],
-            'title_name': rec['title_name'],
-            'category': rec['category'],
-            'sub_category': rec.get('sub_category'),
-            'year': rec['year'],
-            'type': rec['type'],
-            'duration': rec['duration'],
-            'age_rating': rec['age_rating'],
-            'language': rec['language'],
-            'imdb_rating': rec['imdb_rating'],
-            'score': rec['score']
-        } for rec in recommendations]
-
-        return jsonify({
-            'status': 'success',
-            'profile_id': profile_id,
+        cached = {
             'data': recs_data,
-            'count': len(recs_data)
-        })
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+            'body': encode_json({
+                'status': 'success',
+                'profile_id': profile_id,
+                'data': recs_data,
+                'count': len(recs_data)
+            })
+        }
+        _RECOMMENDATIONS_CACHE.set(cache_key, cached)
+
+    return cached
+
+
+def _format_recommendation(rec):
+    """Format a recommendation from the engine for a JSON response."""
+    return {
+        'show_id': rec['show_id'],
+        'title_name': rec['title_name'],
+        'category': rec['category'],
+        'sub_category': rec.get('sub_category'),
+        'year': rec['year'],
+        'type': rec['type'],
+        'duration': rec['duration'],
+        'age_rating': rec['age_rating'],
+        'language': rec['language'],
+        'imdb_rating': rec['imdb_rating'],
+        'score': rec['score']
+    }
 
 
 @app.route('/api/recommendations/<int:profile_id>/category/<category>', methods=['GET'])
@@ -289,7 +614,28 @@ def get_recommendations_by_category(profile_id, category):
         limit = request.args.get('limit', default=10, type=int)
         limit = min(limit, 50)
 
-        recommendations = recommendation_engine.get_recommendations_by_category(
+        # Get recommendations (served from cache when possible)
+        body = _get_cached_category_recommendations(profile_id, category, limit)
+        return Response(body, mimetype='application/json')
+    except Exception as e:
+        return json_response({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+def _get_cached_category_recommendations(profile_id, category, limit):
+    """
+    Get the serialized category recommendations response.
+
+    Cached per (profile_id, category, limit) until the TTL expires or the
+    data is reloaded.
+    """
+    cache_key = (profile_id, category, limit)
+
+    body = _CATEGORY_RECOMMENDATIONS_CACHE.get(cache_key)
+    if body is None:
+        recommendations = get_recommendation_engine().get_recommendations_by_category(
             profile_id=profile_id,
             category=category,
             limit=limit
@@ -306,18 +652,16 @@ def get_recommendations_by_category(profile_id, category):
             'score': rec['score']
         } for rec in recommendations]
 
-        return jsonify({
+        body = encode_json({
             'status': 'success',
             'profile_id': profile_id,
             'category': category,
             'data': recs_data,
             'count': len(recs_data)
         })
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+        _CATEGORY_RECOMMENDATIONS_CACHE.set(cache_key, body)
+
+    return body
 
 
 # ============================================================================
@@ -358,90 +702,85 @@ def filter_titles():
         sort_by = request.args.get('sort_by', default='imdb_rating', type=str)
         order = request.args.get('order', default='desc', type=str)
 
-        # Build query
-        session = db_queries.get_session()
-        try:
-            query = session.query(Title)
+        # Repeat filter combinations are served from the encoded-body cache
+        cache_key = tuple(sorted(request.args.items(multi=True)))
+        cached = _FILTER_CACHE.get(cache_key)
+        if cached is not None:
+            return encoded_json_response(cached)
 
-            # Apply filters
-            if category and category != 'all':
-                query = query.filter(Title.category == category)
+        # Collect the active filters and their values
+        filters = []
+        params = {'limit': limit}
 
-            if content_type and content_type != 'all':
-                if content_type == 'kids':
-                    query = query.filter(Title.is_kids_content == True)
-                else:
-                    query = query.filter(Title.type == content_type)
+        if category and category != 'all':
+            filters.append('category')
+            params['category'] = category
 
-            if age_rating and age_rating != 'all':
-                query = query.filter(Title.age_rating == age_rating)
+        if content_type and content_type != 'all':
+            if content_type == 'kids':
+                filters.append('kids_content')
+            else:
+                filters.append('type')
+                params['type'] = content_type
 
-            if year_min:
-                query = query.filter(Title.year >= year_min)
+        if age_rating and age_rating != 'all':
+            filters.append('age_rating')
+            params['age_rating'] = age_rating
 
-            if year_max:
-                query = query.filter(Title.year <= year_max)
+        if year_min:
+            filters.append('year_min')
+            params['year_min'] = year_min
 
-            if kids_only:
-                query = query.filter(Title.is_kids_content == True)
+        if year_max:
+            filters.append('year_max')
+            params['year_max'] = year_max
 
-            if min_rating:
-                query = query.filter(Title.imdb_rating >= min_rating)
+        if kids_only:
+            filters.append('kids_content')
 
-            if language and language != 'all':
-                query = query.filter(Title.language == language)
+        if min_rating:
+            filters.append('min_rating')
+            params['min_rating'] = min_rating
 
-            # Apply sorting
-            valid_sort_fields = ['imdb_rating', 'year', 'title_name', 'duration']
-            if sort_by not in valid_sort_fields:
-                sort_by = 'imdb_rating'
+        if language and language != 'all':
+            filters.append('language')
+            params['language'] = language
 
-            sort_column = getattr(Title, sort_by)
-            if order == 'asc':
-                query = query.order_by(asc(sort_column))
-            else:
-                query = query.order_by(desc(sort_column))
-
-            # Execute query
-            results = query.limit(limit).all()
-
-            # Format response
-            results_data = [{
-                'show_id': t.show_id,
-                'title_name': t.title_name,
-                'category': t.category,
-                'sub_category': t.sub_category,
-                'year': t.year,
-                'type': t.type,
-                'duration': t.duration,
-                'age_rating': t.age_rating,
-                'language': t.language,
-                'imdb_rating': t.imdb_rating,
-                'imdb_votes': t.imdb_votes,
-                'is_kids_content': t.is_kids_content
-            } for t in results]
-
-            return jsonify({
-                'status': 'success',
-                'data': results_data,
-                'count': len(results_data),
-                'filters_applied': {
-                    'category': category,
-                    'type': content_type,
-                    'age_rating': age_rating,
-                    'year_range': [year_min, year_max] if year_min or year_max else None,
-                    'kids_only': kids_only,
-                    'min_rating': min_rating,
-                    'language': language,
-                    'sort_by': sort_by,
-                    'order': order
-                }
-            })
-        finally:
-            session.close()
+        valid_sort_fields = ['imdb_rating', 'year', 'title_name', 'duration']
+        if sort_by not in valid_sort_fields:
+            sort_by = 'imdb_rating'
+
+        stmt = _build_filter_stmt(
+            tuple(filters), sort_by, 'asc' if order == 'asc' else 'desc'
+        )
+
+        # Execute query (plain rows, no ORM objects)
+        with get_db_queries().session_scope() as session:
+            rows = session.execute(stmt, params).mappings().all()
+            results_data = [dict(row) for row in rows]
+
+        encoded = encode_json_body({
+            'status': 'success',
+            'data': results_data,
+            'count': len(results_data),
+            'filters_applied': {
+                'category': category,
+                'type': content_type,
+                'age_rating': age_rating,
+                'year_range': [year_min, year_max] if year_min or year_max else None,
+                'kids_only': kids_only,
+                'min_rating': min_rating,
+                'language': language,
+                'sort_by': sort_by,
+                'order': order
+            }
+        })
+        _FILTER_CACHE.set(cache_key, encoded)
+
+        return encoded_json_response(encoded)
 
     except Exception as e:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': str(e)
         }), 500
@@ -455,11 +794,16 @@ def get_titles_paginated():
     """
     Get paginated titles.
 
+    Supports two modes: page/offset pagination (default) and keyset
+    pagination, used when `after_id` is given. Keyset mode seeks past the
+    cursor title instead of counting and skipping rows.
+
     Query Parameters:
         page: Page number (default: 1)
         per_page: Items per page (default: 20, max: 100)
         sort_by: Sort field (rating, year, title_name)
         order: asc or desc
+        after_id: Show ID of the last title on the previous page (keyset mode)
 
     Returns:
         JSON response with paginated titles
@@ -469,49 +813,160 @@ def get_titles_paginated():
         per_page = min(request.args.get('per_page', default=20, type=int), 100)
         sort_by = request.args.get('sort_by', default='imdb_rating', type=str)
         order = request.args.get('order', default='desc', type=str)
+        after_id = request.args.get('after_id', type=str)
 
-        session = db_queries.get_session()
-        try:
-            query = session.query(Title)
+        # Only show IDs are read from the database; the rows come from the
+        # title dict cache
+        with get_db_queries().session_scope() as session:
+            query = session.query(Title.show_id)
 
-            # Apply sorting
+            # Apply sorting (show_id breaks ties so pages are stable)
             valid_sort_fields = ['imdb_rating', 'year', 'title_name']
             if sort_by not in valid_sort_fields:
                 sort_by = 'imdb_rating'
 
             sort_column = getattr(Title, sort_by)
-            if order == 'desc':
-                query = query.order_by(desc(sort_column))
+            descending = order == 'desc'
+            if descending:
+                query = query.order_by(desc(sort_column), Title.show_id)
             else:
-                query = query.order_by(asc(sort_column))
+                query = query.order_by(asc(sort_column), Title.show_id)
+
+            if after_id:
+                # Keyset mode: continue after the cursor title
+                cursor = session.query(sort_column).filter(
+                    Title.show_id == after_id
+                ).first()
+
+                if cursor is None:
+                    return json_response({
+                        'status': 'error',
+                        'message': f'Title {after_id} not found'
+                    }), 400
+
+                query = query.filter(
+                    _seek_after(sort_column, cursor[0], after_id, descending)
+                )
+
+                # Fetch one extra row to know whether another page exists
+                show_ids = [row[0] for row in query.limit(per_page + 1)]
+                has_next = len(show_ids) > per_page
+                show_ids = show_ids[:per_page]
+
+                return encoded_json_response(encode_json_body({
+                    'status': 'success',
+                    'data': _get_page_title_dicts(session, show_ids),
+                    'pagination': {
+                        'per_page': per_page,
+                        'after_id': after_id,
+                        'has_next': has_next,
+                        'next_cursor': show_ids[-1] if has_next else None
+                    }
+                }))
 
             # Get total count
-            total = query.count()
+            total = _get_titles_total(session)
 
             # Apply pagination
             offset = (page - 1) * per_page
-            results = query.offset(offset).limit(per_page).all()
+            show_ids = [row[0] for row in query.offset(offset).limit(per_page)]
 
-            return jsonify({
+            return encoded_json_response(encode_json_body({
                 'status': 'success',
-                'data': [t.to_dict() for t in results],
+                'data': _get_page_title_dicts(session, show_ids),
                 'pagination': {
                     'page': page,
                     'per_page': per_page,
                     'total': total,
                     'pages': (total + per_page - 1) // per_page
                 }
-            })
-        finally:
-            session.close()
+            }))
 
     except Exception as e:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': str(e)
         }), 500
 
 
+def _get_page_title_dicts(session, show_ids):
+    """
+    Get the title dicts for a page of show IDs, in order.
+
+    The show IDs come from a live query, but the cache may predate a
+    database rebuild made by another process (the data version only
+    changes in the process that rebuilt it). Titles missing from the cache
+    are read from the database, and the cache is marked stale so the next
+    request reloads it.
+    """
+    title_dicts = _get_title_dicts()
+    missing = [show_id for show_id in show_ids if show_id not in title_dicts]
+    if not missing:
+        return [title_dicts[show_id] for show_id in show_ids]
+
+    fetched = {
+        t.show_id: t.to_dict()
+        for t in session.query(Title).filter(Title.show_id.in_(missing))
+    }
+    _TITLE_DICTS['ts'] = 0
+
+    page = (title_dicts.get(show_id) or fetched.get(show_id) for show_id in show_ids)
+    # A title deleted since the page query is left out
+    return [title for title in page if title is not None]
+
+
+def _get_titles_total(session):
+    """Get the total number of titles, counting them only when stale."""
+    if (
+        _TITLES_TOTAL['value'] is None
+        or time.time() - _TITLES_TOTAL['ts'] >= CATALOG_CACHE_TTL
+        or _TITLES_TOTAL['version'] != get_data_version()
+    ):
+        _TITLES_TOTAL.update({
+            'value': session.query(func.count(Title.id)).scalar(),
+            'ts': time.time(),
+            'version': get_data_version()
+        })
+
+    return _TITLES_TOTAL['value']
+
+
+def _seek_after(sort_column, value, show_id, descending):
+    """
+    Build the filter selecting titles that sort after a cursor title.
+
+    Titles are ordered by (sort_column, show_id). SQLite sorts NULLs first
+    in ascending order and last in descending order.
+
+    Args:
+        sort_column: Column being sorted on
+        value: Sort column value of the cursor title
+        show_id: Show ID of the cursor title
+        descending: Whether the sort column is ordered descending
+
+    Returns:
+        SQLAlchemy filter expression
+    """
+    if descending:
+        if value is None:
+            return and_(sort_column.is_(None), Title.show_id > show_id)
+        return or_(
+            sort_column < value,
+            and_(sort_column == value, Title.show_id > show_id),
+            sort_column.is_(None)
+        )
+
+    if value is None:
+        return or_(
+            and_(sort_column.is_(None), Title.show_id > show_id),
+            sort_column.isnot(None)
+        )
+    return or_(
+        sort_column > value,
+        and_(sort_column == value, Title.show_id > show_id)
+    )
+
+
 # ============================================================================
 # COMBINED DASHBOARD ENDPOINT (Reduces API calls)
 # ============================================================================
@@ -527,29 +982,33 @@ def get_dashboard_data(profile_id):
         JSON with profile info, recommendations, statistics, and categories
     """
     try:
+        # The profile, recommendations, categories and statistics reads are
+        # independent, so run them all on worker threads; the request takes
+        # as long as the slowest one rather than their sum
+        db_queries = get_db_queries()
+        profile_future = _DB_POOL.submit(db_queries.get_profile_by_id, profile_id)
+        recommendations_future = _DB_POOL.submit(_get_cached_recommendations, profile_id, 10)
+        categories_future = _DB_POOL.submit(_all_categories)
+        stats_future = _DB_POOL.submit(db_queries.get_statistics)
+
         # Get profile
-        profile = db_queries.get_profile_by_id(profile_id)
+        profile = profile_future.result()
         if not profile:
-            return jsonify({
+            return json_response({
                 'status': 'error',
                 'message': 'Profile not found'
             }), 404
 
         # Get recommendations
-        recommendations = recommendation_engine.get_recommendations(profile_id, limit=10)
+        recommendations = recommendations_future.result()['data']
 
         # Get categories
-        session = db_queries.get_session()
-        try:
-            categories = session.query(Title.category).distinct().all()
-            categories_list = sorted([c[0] for c in categories if c[0] and c[0] != 'Unknown'])
-        finally:
-            session.close()
+        categories_list = categories_future.result()
 
         # Get stats
-        stats = db_queries.get_statistics()
+        stats = stats_future.result()
 
-        return jsonify({
+        return json_response({
             'status': 'success',
             'data': {
                 'profile': {
@@ -566,7 +1025,7 @@ def get_dashboard_data(profile_id):
             }
         })
     except Exception as e:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': str(e)
         }), 500
@@ -585,20 +1044,20 @@ def get_title(show_id):
         JSON response with title details
     """
     try:
-        title = db_queries.get_title_by_show_id(show_id)
+        title = _get_title_dicts().get(show_id)
 
         if not title:
-            return jsonify({
+            return json_response({
                 'status': 'error',
                 'message': f'Title {show_id} not found'
             }), 404
 
-        return jsonify({
+        return cacheable_json_response(encode_json({
             'status': 'success',
-            'data': title.to_dict()
-        })
+            'data': title
+        }))
     except Exception as e:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': str(e)
         }), 500
@@ -622,7 +1081,7 @@ def get_similar_titles(show_id):
         limit = request.args.get('limit', default=10, type=int)
         limit = min(limit, 20)
 
-        similar = recommendation_engine.get_similar_titles(
+        similar = get_recommendation_engine().get_similar_titles(
             show_id=show_id,
             limit=limit
         )
@@ -636,14 +1095,14 @@ def get_similar_titles(show_id):
             'similarity_score': s['score']
         } for s in similar]
 
-        return jsonify({
+        return json_response({
             'status': 'success',
             'show_id': show_id,
             'data': similar_data,
             'count': len(similar_data)
         })
     except Exception as e:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': str(e)
         }), 500
@@ -667,12 +1126,12 @@ def search_titles():
         limit = min(limit, 50)
 
         if not query:
-            return jsonify({
+            return json_response({
                 'status': 'error',
                 'message': 'Query parameter "q" is required'
             }), 400
 
-        results = db_queries.search_titles(query, limit=limit)
+        results = get_db_queries().search_titles(query, limit=limit)
 
         results_data = [{
             'show_id': t.show_id,
@@ -684,14 +1143,14 @@ def search_titles():
             'imdb_rating': t.imdb_rating
         } for t in results]
 
-        return jsonify({
+        return json_response({
             'status': 'success',
             'query': query,
             'data': results_data,
             'count': len(results_data)
         })
     except Exception as e:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': str(e)
         }), 500
@@ -707,20 +1166,10 @@ def get_categories():
         JSON response with list of categories
     """
     try:
-        session = db_queries.get_session()
-        try:
-            categories = session.query(Title.category).distinct().all()
-            categories_list = sorted([c[0] for c in categories if c[0] and c[0] != 'Unknown'])
-
-            return jsonify({
-                'status': 'success',
-                'data': categories_list,
-                'count': len(categories_list)
-            })
-        finally:
-            session.close()
+        categories = _get_categories_cache()
+        return cacheable_json_response(categories['body'], categories['etag'])
     except Exception as e:
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': str(e)
         }), 500
@@ -4,7 +4,9 @@ Data Cleaning Module for Streamly Recommendation System
 This module handles loading, analyzing, and cleaning the raw data files.
 """
 
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
@@ -15,6 +17,13 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
+# A Parquet copy of the cleaned CSVs is optional (requires pyarrow)
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
 # Import config with fallback
 try:
     from config.config import (
@@ -42,6 +51,68 @@ except ImportError:
     ADULT_AGE_RATINGS = ['13+', '16+', '18+']
 
 
+logger = logging.getLogger(__name__)
+
+
+# Column types of the raw CSV files, so pandas doesn't have to infer them.
+# Only columns that are never filled or grouped on are read as categoricals.
+# Integer and boolean columns are read as nullable types, so a row with a
+# gap is kept; they are cast to the compact types below once filled.
+RAW_TITLES_DTYPES = {
+    'show_id': str,
+    'title_name': str,
+    'category': str,
+    'sub_category': str,
+    'duration': 'Int32',
+    'age_rating': 'category',
+    'type': 'category',
+    'year': 'Int16',
+    'origin_region': str,
+    'language': str,
+    'episode_count': 'Int32',
+    'is_kids_content': 'boolean',
+    'imdb_rating': 'float64',
+    'imdb_votes': 'float64'
+}
+RAW_PROFILES_DTYPES = {
+    'profile_id': 'Int32',
+    'account_id': 'Int32',
+    'profile_name': str,
+    'kids_profile': 'boolean',
+    'age_band': str,
+    'preferred_language': str,
+    'preferences': str
+}
+CLEAN_TITLES_DTYPES = {
+    'duration': 'int32',
+    'year': 'int16',
+    'episode_count': 'int32',
+    'is_kids_content': bool
+}
+CLEAN_PROFILES_DTYPES = {
+    'profile_id': 'int32',
+    'account_id': 'int32',
+    'kids_profile': bool
+}
+
+
+def days_since(dates):
+    """
+    Get the number of whole days from each date until today.
+
+    Works on day-resolution datetime64 values, so it is a single integer
+    subtraction rather than building Timedelta values.
+
+    Args:
+        dates: Series of dates (datetime64)
+
+    Returns:
+        int32 NumPy array of day counts
+    """
+    today = np.datetime64(datetime.now().date(), 'D')
+    return (today - dates.to_numpy().astype('datetime64[D]')).astype('int32')
+
+
 class DataCleaner:
     """Handles data loading, validation, and cleaning operations."""
 
@@ -54,257 +125,343 @@ class DataCleaner:
 
     def load_data(self):
         """Load raw CSV files."""
-        print("=" * 80)
-        print("LOADING RAW DATA")
-        print("=" * 80)
+        logger.info("=" * 80)
+        logger.info("LOADING RAW DATA")
+        logger.info("=" * 80)
 
         try:
-            # Load titles
             titles_path = RAW_DATA_DIR / 'titles.csv'
-            self.titles_df = pd.read_csv(titles_path)
-            print(f"✓ Loaded titles.csv: {self.titles_df.shape[0]} rows, {self.titles_df.shape[1]} columns")
-
-            # Load profiles
             profiles_path = RAW_DATA_DIR / 'profiles.csv'
-            self.profiles_df = pd.read_csv(profiles_path)
-            print(f"✓ Loaded profiles.csv: {self.profiles_df.shape[0]} rows, {self.profiles_df.shape[1]} columns")
 
-            print("\n✓ Data loading complete")
+            # Read both files concurrently (the CSV parser releases the GIL)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                titles_future = executor.submit(
+                    pd.read_csv, titles_path, dtype=RAW_TITLES_DTYPES
+                )
+                profiles_future = executor.submit(
+                    pd.read_csv, profiles_path,
+                    dtype=RAW_PROFILES_DTYPES, parse_dates=['created_at']
+                )
+                self.titles_df = titles_future.result()
+                self.profiles_df = profiles_future.result()
+
+            logger.info(
+                "✓ Loaded titles.csv: %s rows, %s columns",
+                self.titles_df.shape[0], self.titles_df.shape[1]
+            )
+            logger.info(
+                "✓ Loaded profiles.csv: %s rows, %s columns",
+                self.profiles_df.shape[0], self.profiles_df.shape[1]
+            )
+
+            logger.info("\n✓ Data loading complete")
             return True
 
         except FileNotFoundError as e:
-            print(f"✗ Error: {e}")
-            print(f"\nPlease ensure CSV files are in: {RAW_DATA_DIR}")
+            logger.error("✗ Error: %s", e)
+            logger.info("\nPlease ensure CSV files are in: %s", RAW_DATA_DIR)
             return False
 
     def analyze_data_quality(self):
         """Analyze data quality and identify anomalies."""
-        print("\n" + "=" * 80)
-        print("DATA QUALITY ANALYSIS")
-        print("=" * 80)
+        # The analysis is only reported, so skip its scans when nobody sees it
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        logger.info("\n" + "=" * 80)
+        logger.info("DATA QUALITY ANALYSIS")
+        logger.info("=" * 80)
 
         # Titles analysis
-        print("\n📊 TITLES DATASET")
-        print("-" * 80)
-        print(f"Total records: {len(self.titles_df)}")
-        print(f"Duplicate show_ids: {self.titles_df['show_id'].duplicated().sum()}")
-        print(f"Missing values: {self.titles_df.isnull().sum().sum()}")
-        print(f"\nMissing by column:")
+        logger.info("\n📊 TITLES DATASET")
+        logger.info("-" * 80)
+        logger.info("Total records: %s", len(self.titles_df))
+        logger.info("Duplicate show_ids: %s", self.titles_df['show_id'].duplicated().sum())
         missing_titles = self.titles_df.isnull().sum()
+        logger.info("Missing values: %s", missing_titles.sum())
+        logger.info("\nMissing by column:")
         for col, count in missing_titles[missing_titles > 0].items():
-            print(f"  - {col}: {count} ({count/len(self.titles_df)*100:.1f}%)")
+            logger.info("  - %s: %s (%.1f%%)", col, count, count/len(self.titles_df)*100)
 
         # Identify anomalies
-        print("\n⚠️  ANOMALIES DETECTED:")
+        logger.warning("\n⚠️  ANOMALIES DETECTED:")
 
-        # Kids content with adult ratings
-        kids_adult_rating = self.titles_df[
-            (self.titles_df['is_kids_content'] == True) & 
+        # Kids content with adult ratings (counted with sum(), which skips
+        # missing values)
+        kids_adult_rating = int((
+            self.titles_df['is_kids_content'] &
             (self.titles_df['age_rating'].isin(['18+', '16+', '13+']))
-        ]
-        if len(kids_adult_rating) > 0:
-            print(f"  - Kids content with adult ratings: {len(kids_adult_rating)}")
+        ).sum())
+        if kids_adult_rating > 0:
+            logger.info("  - Kids content with adult ratings: %s", kids_adult_rating)
 
         # Movies with multiple episodes
-        movies_multi_ep = self.titles_df[
-            (self.titles_df['type'] == 'Movie') & 
+        movies_multi_ep = int((
+            (self.titles_df['type'] == 'Movie') &
             (self.titles_df['episode_count'] > 1)
-        ]
-        if len(movies_multi_ep) > 0:
-            print(f"  - Movies with >1 episode: {len(movies_multi_ep)}")
+        ).sum())
+        if movies_multi_ep > 0:
+            logger.info("  - Movies with >1 episode: %s", movies_multi_ep)
 
         # Profiles analysis
-        print("\n👥 PROFILES DATASET")
-        print("-" * 80)
-        print(f"Total records: {len(self.profiles_df)}")
-        print(f"Duplicate profile_ids: {self.profiles_df['profile_id'].duplicated().sum()}")
-        print(f"Missing values: {self.profiles_df.isnull().sum().sum()}")
-        print(f"Unique accounts: {self.profiles_df['account_id'].nunique()}")
+        logger.info("\n👥 PROFILES DATASET")
+        logger.info("-" * 80)
+        logger.info("Total records: %s", len(self.profiles_df))
+        logger.info("Duplicate profile_ids: %s", self.profiles_df['profile_id'].duplicated().sum())
+        missing_profiles = self.profiles_df.isnull().sum()
+        logger.info("Missing values: %s", missing_profiles.sum())
+        logger.info("Unique accounts: %s", self.profiles_df['account_id'].nunique())
 
     def clean_titles(self):
         """Clean titles dataset."""
-        print("\n" + "=" * 80)
-        print("CLEANING TITLES DATASET")
-        print("=" * 80)
-
-        # Create a copy
-        titles_clean = self.titles_df.copy()
+        logger.info("\n" + "=" * 80)
+        logger.info("CLEANING TITLES DATASET")
+        logger.info("=" * 80)
+
+        # Cleaned in place: the raw frame isn't needed afterwards
+        titles_clean = self.titles_df
+
+        # 0. Fill missing numeric fields (durations with the median for the
+        # title's type, else overall; years with the median year), then use
+        # the compact types
+        logger.info("\n0. Handling missing numeric fields...")
+        missing = titles_clean[list(CLEAN_TITLES_DTYPES)].isna().sum()
+        duration = titles_clean['duration']
+        titles_clean.fillna({
+            'duration': duration.groupby(titles_clean['type'], observed=True)
+            .transform('median').fillna(duration.median()).round(),
+            'year': np.round(titles_clean['year'].median()),
+            'episode_count': 1,
+            'is_kids_content': False
+        }, inplace=True)
+        titles_clean[list(CLEAN_TITLES_DTYPES)] = titles_clean[
+            list(CLEAN_TITLES_DTYPES)
+        ].astype(CLEAN_TITLES_DTYPES)
+
+        logger.info(
+            "   ✓ Filled %s durations, %s years, %s episode counts, %s kids flags",
+            missing['duration'], missing['year'], missing['episode_count'],
+            missing['is_kids_content']
+        )
+        self.cleaning_log.append(
+            f"Filled {missing['duration']} missing durations (median for the type), "
+            f"{missing['year']} missing years (median year), "
+            f"{missing['episode_count']} missing episode counts (1) and "
+            f"{missing['is_kids_content']} missing kids flags (False)"
+        )
 
         # 1. Fix kids_content inconsistency
-        print("\n1. Fixing kids_content inconsistencies...")
-        inconsistent_count = len(titles_clean[
-            (titles_clean['is_kids_content'] == True) & 
+        logger.info("\n1. Fixing kids_content inconsistencies...")
+        inconsistent = (
+            titles_clean['is_kids_content'] &
             (titles_clean['age_rating'].isin(['18+', '16+']))
-        ])
-
-        titles_clean.loc[
-            (titles_clean['is_kids_content'] == True) & 
-            (titles_clean['age_rating'].isin(['18+', '16+'])),
-            'is_kids_content'
-        ] = False
+        )
+        inconsistent_count = int(inconsistent.sum())
+        titles_clean.loc[inconsistent, 'is_kids_content'] = False
 
-        print(f"   ✓ Fixed {inconsistent_count} kids content with adult ratings")
+        logger.info("   ✓ Fixed %s kids content with adult ratings", inconsistent_count)
         self.cleaning_log.append(f"Fixed {inconsistent_count} kids content with 18+/16+ ratings")
 
         # 2. Fix episode count for movies
-        print("\n2. Fixing episode count for movies...")
-        movies_count = len(titles_clean[
+        logger.info("\n2. Fixing episode count for movies...")
+        multi_episode_movies = (
             (titles_clean['type'] == 'Movie') & 
             (titles_clean['episode_count'] > 1)
-        ])
-
-        titles_clean.loc[
-            (titles_clean['type'] == 'Movie') & 
-            (titles_clean['episode_count'] > 1),
-            'episode_count'
-        ] = 1
+        )
+        movies_count = int(multi_episode_movies.sum())
+        titles_clean.loc[multi_episode_movies, 'episode_count'] = 1
 
-        print(f"   ✓ Fixed {movies_count} movies with incorrect episode counts")
+        logger.info("   ✓ Fixed %s movies with incorrect episode counts", movies_count)
         self.cleaning_log.append(f"Fixed {movies_count} movies with >1 episode")
 
-        # 3. Handle missing categories
-        print("\n3. Handling missing categories...")
-        missing_cat = titles_clean['category'].isnull().sum()
-        titles_clean['category'] = titles_clean['category'].fillna('Unknown')
-        print(f"   ✓ Filled {missing_cat} missing categories")
-        self.cleaning_log.append(f"Filled {missing_cat} missing categories")
-
-        # 4. Handle missing sub_categories
-        print("\n4. Handling missing sub-categories...")
-        missing_subcat = titles_clean['sub_category'].isnull().sum()
-        titles_clean['sub_category'] = titles_clean.apply(
-            lambda row: row['category'] if pd.isnull(row['sub_category']) else row['sub_category'],
-            axis=1
+        # 3-6. Handle missing text fields: count the gaps in one pass, then fill
+        # the 'Unknown' columns together (sub_category falls back to category)
+        missing = titles_clean[
+            ['category', 'sub_category', 'origin_region', 'language']
+        ].isnull().sum()
+        titles_clean.fillna(
+            {'category': 'Unknown', 'origin_region': 'Unknown', 'language': 'Unknown'},
+            inplace=True
         )
-        print(f"   ✓ Filled {missing_subcat} missing sub-categories")
-        self.cleaning_log.append(f"Filled {missing_subcat} missing sub-categories")
-
-        # 5. Handle missing origin_region
-        print("\n5. Handling missing origin regions...")
-        missing_region = titles_clean['origin_region'].isnull().sum()
-        titles_clean['origin_region'] = titles_clean['origin_region'].fillna('Unknown')
-        print(f"   ✓ Filled {missing_region} missing origin regions")
-        self.cleaning_log.append(f"Filled {missing_region} missing origin regions")
-
-        # 6. Handle missing language
-        print("\n6. Handling missing languages...")
-        missing_lang = titles_clean['language'].isnull().sum()
-        titles_clean['language'] = titles_clean['language'].fillna('Unknown')
-        print(f"   ✓ Filled {missing_lang} missing languages")
-        self.cleaning_log.append(f"Filled {missing_lang} missing languages")
+        titles_clean['sub_category'] = titles_clean['sub_category'].fillna(titles_clean['category'])
+
+        logger.info("\n3. Handling missing categories...")
+        logger.info("   ✓ Filled %s missing categories", missing['category'])
+        self.cleaning_log.append(f"Filled {missing['category']} missing categories")
+
+        logger.info("\n4. Handling missing sub-categories...")
+        logger.info("   ✓ Filled %s missing sub-categories", missing['sub_category'])
+        self.cleaning_log.append(f"Filled {missing['sub_category']} missing sub-categories")
+
+        logger.info("\n5. Handling missing origin regions...")
+        logger.info("   ✓ Filled %s missing origin regions", missing['origin_region'])
+        self.cleaning_log.append(f"Filled {missing['origin_region']} missing origin regions")
+
+        logger.info("\n6. Handling missing languages...")
+        logger.info("   ✓ Filled %s missing languages", missing['language'])
+        self.cleaning_log.append(f"Filled {missing['language']} missing languages")
 
         # 7. Add quality flags
-        print("\n7. Adding data quality flags...")
-        titles_clean['has_imdb_data'] = titles_clean['imdb_rating'].notnull()
+        logger.info("\n7. Adding data quality flags...")
+        completeness_columns = [
+            'category', 'sub_category', 'origin_region', 'language', 'imdb_rating'
+        ]
+        present = titles_clean[completeness_columns].notnull().to_numpy()
+        titles_clean['has_imdb_data'] = present[:, completeness_columns.index('imdb_rating')]
         titles_clean['data_completeness_score'] = (
-            titles_clean['category'].notnull().astype(int) +
-            titles_clean['sub_category'].notnull().astype(int) +
-            titles_clean['origin_region'].notnull().astype(int) +
-            titles_clean['language'].notnull().astype(int) +
-            titles_clean['imdb_rating'].notnull().astype(int)
-        ) / 5
-        print("   ✓ Added has_imdb_data and data_completeness_score")
+            present.sum(axis=1, dtype=np.uint8) / len(completeness_columns)
+        )
+        logger.info("   ✓ Added has_imdb_data and data_completeness_score")
         self.cleaning_log.append("Added data quality flags")
 
-        self.titles_df = titles_clean
-        print("\n✓ Titles cleaning complete")
+        logger.info("\n✓ Titles cleaning complete")
 
     def clean_profiles(self):
         """Clean profiles dataset."""
-        print("\n" + "=" * 80)
-        print("CLEANING PROFILES DATASET")
-        print("=" * 80)
-
-        profiles_clean = self.profiles_df.copy()
+        logger.info("\n" + "=" * 80)
+        logger.info("CLEANING PROFILES DATASET")
+        logger.info("=" * 80)
+
+        profiles_clean = self.profiles_df
+
+        # 0. Drop rows without IDs, fill missing kids flags, then use the
+        # compact types
+        logger.info("\n0. Handling missing IDs and kids flags...")
+        missing_ids = profiles_clean[['profile_id', 'account_id']].isna().any(axis=1)
+        missing_ids_count = int(missing_ids.sum())
+        if missing_ids_count:
+            profiles_clean = self.profiles_df = profiles_clean[~missing_ids].copy()
+        missing_kids = int(profiles_clean['kids_profile'].isna().sum())
+        profiles_clean['kids_profile'] = profiles_clean['kids_profile'].fillna(False)
+        profiles_clean[list(CLEAN_PROFILES_DTYPES)] = profiles_clean[
+            list(CLEAN_PROFILES_DTYPES)
+        ].astype(CLEAN_PROFILES_DTYPES)
+
+        logger.info(
+            "   ✓ Dropped %s profiles without IDs, filled %s kids flags",
+            missing_ids_count, missing_kids
+        )
+        self.cleaning_log.append(
+            f"Dropped {missing_ids_count} profiles without IDs, "
+            f"filled {missing_kids} missing kids flags (False)"
+        )
 
         # 1. Parse preferences
-        print("\n1. Processing preferences...")
+        logger.info("\n1. Processing preferences...")
         profiles_clean['preferences_list'] = profiles_clean['preferences'].str.split(', ')
-        profiles_clean['preference_count'] = profiles_clean['preferences_list'].apply(len)
-        print("   ✓ Added preferences_list and preference_count")
+        # Count separators in the string rather than measuring each list
+        profiles_clean['preference_count'] = (
+            profiles_clean['preferences'].str.count(', ').add(1).fillna(0).astype(int)
+        )
+        logger.info("   ✓ Added preferences_list and preference_count")
         self.cleaning_log.append("Processed preferences into list format")
 
         # 2. Add age band ordering
-        print("\n2. Adding age band ordering...")
+        logger.info("\n2. Adding age band ordering...")
         profiles_clean['age_band_order'] = profiles_clean['age_band'].map(AGE_BAND_ORDER)
-        print("   ✓ Added age_band_order")
+        logger.info("   ✓ Added age_band_order")
         self.cleaning_log.append("Added age_band_order for sorting")
 
         # 3. Parse dates
-        print("\n3. Parsing dates...")
+        logger.info("\n3. Parsing dates...")
         profiles_clean['created_at_date'] = pd.to_datetime(profiles_clean['created_at'])
-        profiles_clean['account_age_days'] = (
-            pd.Timestamp.now() - profiles_clean['created_at_date']
-        ).dt.days
-        print("   ✓ Added created_at_date and account_age_days")
+        profiles_clean['account_age_days'] = days_since(profiles_clean['created_at_date'])
+        logger.info("   ✓ Added created_at_date and account_age_days")
         self.cleaning_log.append("Parsed dates and calculated account age")
 
-        self.profiles_df = profiles_clean
-        print("\n✓ Profiles cleaning complete")
+        logger.info("\n✓ Profiles cleaning complete")
 
     def create_accounts_dataset(self):
         """Create accounts dataset from profiles."""
-        print("\n" + "=" * 80)
-        print("CREATING ACCOUNTS DATASET")
-        print("=" * 80)
+        logger.info("\n" + "=" * 80)
+        logger.info("CREATING ACCOUNTS DATASET")
+        logger.info("=" * 80)
 
         # Aggregate by account_id
-        accounts = self.profiles_df.groupby('account_id').agg({
-            'created_at': 'min',
-            'profile_id': 'count'
-        }).reset_index()
-        accounts.columns = ['account_id', 'created_at', 'profile_count']
-
-        # Get primary language (most common per account)
-        account_languages = self.profiles_df.groupby('account_id')['preferred_language'].agg(
-            lambda x: x.mode()[0] if len(x.mode()) > 0 else x.iloc[0]
+        accounts = self.profiles_df.groupby('account_id').agg(
+            created_at=('created_at', 'min'),
+            profile_count=('profile_id', 'count')
         ).reset_index()
+
+        # Get primary language (most common per account, ties broken
+        # alphabetically like Series.mode)
+        language_counts = self.profiles_df.groupby(
+            ['account_id', 'preferred_language']
+        ).size().reset_index(name='n')
+        account_languages = language_counts.sort_values(
+            ['account_id', 'n', 'preferred_language'],
+            ascending=[True, False, True]
+        ).drop_duplicates('account_id')[['account_id', 'preferred_language']]
         account_languages.columns = ['account_id', 'primary_language']
 
-        # Merge
-        accounts = accounts.merge(account_languages, on='account_id')
+        # Merge (accounts without a known language get NaN)
+        accounts = accounts.merge(account_languages, on='account_id', how='left')
 
         # Parse dates
         accounts['created_at_date'] = pd.to_datetime(accounts['created_at'])
-        accounts['account_age_days'] = (
-            pd.Timestamp.now() - accounts['created_at_date']
-        ).dt.days
+        accounts['account_age_days'] = days_since(accounts['created_at_date'])
 
         self.accounts_df = accounts
-        print(f"\n✓ Created accounts dataset: {len(accounts)} accounts")
-        self.cleaning_log.append(f"Created accounts dataset from profiles ({len(accounts)} accounts)")
+        logger.info("\n✓ Created accounts dataset: %s accounts", len(accounts))
+        self.cleaning_log.append(
+            f"Created accounts dataset from profiles ({len(accounts)} accounts)"
+        )
+
+    def save_cleaned_file(self, df, csv_path):
+        """
+        Save a cleaned dataset.
+
+        The CSV is always written. When pyarrow is installed a Parquet copy
+        (zstd-compressed, column types preserved) is written next to it for
+        faster loading; otherwise a Parquet copy left by an earlier run is
+        removed, so a Parquet file is never older than its CSV.
+
+        Returns:
+            List of written paths
+        """
+        parquet_path = csv_path.with_suffix('.parquet')
+        parquet_path.unlink(missing_ok=True)
+
+        df.to_csv(csv_path, index=False)
+        paths = [csv_path]
+
+        if PARQUET_AVAILABLE:
+            df.to_parquet(parquet_path, compression='zstd', index=False)
+            paths.append(parquet_path)
+        return paths
 
     def save_cleaned_data(self):
-        """Save cleaned datasets to CSV files."""
-        print("\n" + "=" * 80)
-        print("SAVING CLEANED DATA")
-        print("=" * 80)
+        """Save cleaned datasets (CSV, plus Parquet if available)."""
+        logger.info("\n" + "=" * 80)
+        logger.info("SAVING CLEANED DATA")
+        logger.info("=" * 80)
 
         # Ensure directory exists
         CLEANED_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-        # Save titles
-        titles_path = CLEANED_DATA_DIR / 'titles_cleaned.csv'
-        self.titles_df.to_csv(titles_path, index=False)
-        print(f"✓ Saved: {titles_path}")
-
-        # Save profiles
-        profiles_path = CLEANED_DATA_DIR / 'profiles_cleaned.csv'
-        self.profiles_df.to_csv(profiles_path, index=False)
-        print(f"✓ Saved: {profiles_path}")
+        outputs = [
+            (self.titles_df, CLEANED_DATA_DIR / 'titles_cleaned.csv'),
+            (self.profiles_df, CLEANED_DATA_DIR / 'profiles_cleaned.csv'),
+            (self.accounts_df, CLEANED_DATA_DIR / 'accounts_cleaned.csv')
+        ]
 
-        # Save accounts
-        accounts_path = CLEANED_DATA_DIR / 'accounts_cleaned.csv'
-        self.accounts_df.to_csv(accounts_path, index=False)
-        print(f"✓ Saved: {accounts_path}")
+        # Write the files concurrently
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            futures = [
+                executor.submit(self.save_cleaned_file, df, path)
+                for df, path in outputs
+            ]
+            for future in futures:
+                for path in future.result():
+                    logger.info("✓ Saved: %s", path)
 
-        print("\n✓ All cleaned data saved successfully")
+        logger.info("\n✓ All cleaned data saved successfully")
 
     def generate_cleaning_report(self):
         """Generate and save cleaning report."""
-        print("\n" + "=" * 80)
-        print("GENERATING CLEANING REPORT")
-        print("=" * 80)
+        logger.info("\n" + "=" * 80)
+        logger.info("GENERATING CLEANING REPORT")
+        logger.info("=" * 80)
 
         report = {
             'timestamp': datetime.now().isoformat(),
@@ -330,14 +487,14 @@ class DataCleaner:
             for i, step in enumerate(report['cleaning_steps'], 1):
                 f.write(f"  {i}. {step}\n")
 
-        print(f"✓ Report saved: {report_path}")
+        logger.info("✓ Report saved: %s", report_path)
 
     def run(self):
         """Execute the complete data cleaning pipeline."""
-        print("\n" + "=" * 80)
-        print("STREAMLY DATA CLEANING PIPELINE")
-        print("=" * 80)
-        print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info("\n" + "=" * 80)
+        logger.info("STREAMLY DATA CLEANING PIPELINE")
+        logger.info("=" * 80)
+        logger.info("Started at: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
 
         # Load data
         if not self.load_data():
@@ -355,16 +512,18 @@ class DataCleaner:
         self.save_cleaned_data()
         self.generate_cleaning_report()
 
-        print("\n" + "=" * 80)
-        print("✅ DATA CLEANING PIPELINE COMPLETE")
-        print("=" * 80)
-        print(f"Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info("\n" + "=" * 80)
+        logger.info("✅ DATA CLEANING PIPELINE COMPLETE")
+        logger.info("=" * 80)
+        logger.info("Completed at: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
 
         return True
 
 
 def main():
     """Main entry point."""
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+
     cleaner = DataCleaner()
     success = cleaner.run()
 
@@ -0,0 +1,87 @@
+"""
+Cache Utilities for Streamly Recommendation System
+
+This module tracks the version of the loaded data so that in-process caches
+can be invalidated when the database is rebuilt, and provides a small
+thread-safe TTL cache built on top of it.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+# Bumped every time the database is (re)loaded
+DATA_VERSION = 0
+
+
+def get_data_version():
+    """Get the current data version."""
+    return DATA_VERSION
+
+
+def bump_data_version():
+    """Invalidate in-process caches after the database has been rebuilt."""
+    global DATA_VERSION
+    DATA_VERSION += 1
+    return DATA_VERSION
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time.
+
+    All entries are dropped when the data version changes.
+    """
+
+    def __init__(self, maxsize=1024, ttl=300):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept (least recently used go first)
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = get_data_version()
+
+    def _check_version(self):
+        """Drop all entries if the data has been reloaded."""
+        if self._version != get_data_version():
+            self._entries.clear()
+            self._version = get_data_version()
+
+    def get(self, key, default=None):
+        """Get a cached value, or default if missing or expired."""
+        with self._lock:
+            self._check_version()
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._check_version()
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -4,6 +4,7 @@ Database Setup Module for Streamly Recommendation System
 This module handles database creation, connection, and data loading.
 """
 
+import logging
 import sys
 from pathlib import Path
 
@@ -13,12 +14,21 @@ sys.path.insert(0, str(project_root))
 
 # Now import after path is set
 import pandas as pd
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 
+# Parquet input is optional (requires pyarrow)
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
 # Import models
 from src.database.models import Base, Account, Profile, Title
+from src.database.cache import bump_data_version
+from src.database.migrations import upgrade_schema
+from src.recommendation.popularity import popularity_score
 
 # Import config with fallback
 try:
@@ -34,6 +44,117 @@ except ImportError:
     LOG_DIR = project_root / 'logs'
 
 
+logger = logging.getLogger(__name__)
+
+
+# Column types of the cleaned data files. Only these columns are read (plus
+# created_at, which is parsed as a date), and pandas doesn't infer types.
+CLEANED_ACCOUNTS_DTYPES = {
+    'account_id': 'int64',
+    'primary_language': str,
+    'profile_count': 'int64',
+    'account_age_days': 'int64'
+}
+CLEANED_PROFILES_DTYPES = {
+    'profile_id': 'int64',
+    'account_id': 'int64',
+    'profile_name': str,
+    'kids_profile': bool,
+    'age_band': str,
+    'age_band_order': 'int64',
+    'preferred_language': str,
+    'preferences': str,
+    'preference_count': 'int64',
+    'account_age_days': 'int64'
+}
+CLEANED_TITLES_DTYPES = {
+    'show_id': str,
+    'title_name': str,
+    'category': str,
+    'sub_category': str,
+    'duration': 'int64',
+    'age_rating': str,
+    'type': str,
+    'year': 'int64',
+    'origin_region': str,
+    'language': str,
+    'episode_count': 'int64',
+    'is_kids_content': bool,
+    'imdb_rating': 'float64',
+    'imdb_votes': 'float64',
+    'has_imdb_data': bool,
+    'data_completeness_score': 'float64'
+}
+
+# Rows read from a cleaned file at a time, and per executemany batch
+CSV_CHUNKSIZE = 100000
+BULK_INSERT_CHUNKSIZE = 10000
+
+# SQLite settings for every setup connection: WAL with NORMAL sync avoids an
+# fsync per commit, and the large page cache keeps index builds in memory
+SETUP_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-200000',  # ~200 MB
+)
+
+# Durability is relaxed further while bulk loading, then restored
+BULK_LOAD_PRAGMAS = ('PRAGMA synchronous=OFF',)
+AFTER_LOAD_PRAGMAS = ('PRAGMA synchronous=NORMAL',)
+
+# Triggers keeping the titles_fts search index in step with titles
+SEARCH_INDEX_TRIGGERS = {
+    'titles_fts_insert': (
+        "CREATE TRIGGER titles_fts_insert AFTER INSERT ON titles BEGIN "
+        "INSERT INTO titles_fts(rowid, title_name) VALUES (new.id, new.title_name); "
+        "END"
+    ),
+    'titles_fts_delete': (
+        "CREATE TRIGGER titles_fts_delete AFTER DELETE ON titles BEGIN "
+        "INSERT INTO titles_fts(titles_fts, rowid, title_name) "
+        "VALUES ('delete', old.id, old.title_name); "
+        "END"
+    ),
+    'titles_fts_update': (
+        "CREATE TRIGGER titles_fts_update AFTER UPDATE OF title_name ON titles BEGIN "
+        "INSERT INTO titles_fts(titles_fts, rowid, title_name) "
+        "VALUES ('delete', old.id, old.title_name); "
+        "INSERT INTO titles_fts(rowid, title_name) VALUES (new.id, new.title_name); "
+        "END"
+    ),
+}
+
+# Rated titles ranked globally and within each category. Equal ratings
+# rank more votes first, then the most recently added title (the order the
+# ix_title_rated index returns them in)
+TOP_RATED_SQL = """
+INSERT INTO top_rated (scope, rank, show_id)
+SELECT 'global', ROW_NUMBER() OVER (
+    ORDER BY imdb_rating DESC, imdb_votes DESC, id DESC
+), show_id
+FROM titles WHERE has_imdb_data = 1
+UNION ALL
+SELECT category, ROW_NUMBER() OVER (
+    PARTITION BY category ORDER BY imdb_rating DESC, imdb_votes DESC, id DESC
+), show_id
+FROM titles WHERE has_imdb_data = 1
+"""
+
+# Record counts checked after loading, fetched as one row
+VERIFY_COUNTS_SQL = """
+SELECT
+    (SELECT COUNT(*) FROM accounts) AS accounts,
+    (SELECT COUNT(*) FROM profiles) AS profiles,
+    (SELECT COUNT(*) FROM titles) AS titles,
+    (SELECT COUNT(*) FROM profiles WHERE account_id = 1) AS account_profiles,
+    (SELECT COUNT(*) FROM titles WHERE is_kids_content = 1) AS kids_titles,
+    (SELECT COUNT(*) FROM titles WHERE age_rating = 'PG') AS pg_titles,
+    (SELECT COUNT(*) FROM titles WHERE language = 'en') AS english_titles,
+    (SELECT COUNT(*) FROM titles WHERE has_imdb_data = 1) AS rated_titles
+"""
+
+
 class DatabaseManager:
     """Manages database operations including creation and data loading."""
 
@@ -50,7 +171,7 @@ class DatabaseManager:
 
     def create_engine_and_session(self):
         """Create database engine and session factory."""
-        print(f"\nConnecting to database: {self.db_path}")
+        logger.info("\nConnecting to database: %s", self.db_path)
 
         # Ensure directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
@@ -61,10 +182,19 @@ class DatabaseManager:
             echo=False  # Set to True for SQL debugging
         )
 
+        @event.listens_for(self.engine, 'connect')
+        def set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma in SETUP_PRAGMAS:
+                    cursor.execute(pragma)
+            finally:
+                cursor.close()
+
         # Create session factory
         self.Session = sessionmaker(bind=self.engine)
 
-        print("✓ Database engine created")
+        logger.info("✓ Database engine created")
 
     def create_tables(self, drop_existing=False):
         """
@@ -73,144 +203,242 @@ class DatabaseManager:
         Args:
             drop_existing: If True, drop existing tables before creating new ones.
         """
-        print("\n" + "=" * 80)
-        print("CREATING DATABASE TABLES")
-        print("=" * 80)
+        logger.info("\n" + "=" * 80)
+        logger.info("CREATING DATABASE TABLES")
+        logger.info("=" * 80)
 
         if drop_existing:
-            print("\n⚠️  Dropping existing tables...")
+            logger.warning("\n⚠️  Dropping existing tables...")
             Base.metadata.drop_all(self.engine)
-            print("✓ Existing tables dropped")
+            logger.info("✓ Existing tables dropped")
 
-        # Create all tables
+        # Create all tables (and add columns missing from an older database)
         Base.metadata.create_all(self.engine)
+        upgrade_schema(self.engine)
 
         # Verify tables were created
         inspector = inspect(self.engine)
         tables = inspector.get_table_names()
 
-        print(f"\n✓ Created {len(tables)} tables:")
+        logger.info("\n✓ Created %s tables:", len(tables))
         for table in tables:
             columns = inspector.get_columns(table)
             indexes = inspector.get_indexes(table)
-            print(f"  - {table}: {len(columns)} columns, {len(indexes)} indexes")
+            logger.info("  - %s: %s columns, %s indexes", table, len(columns), len(indexes))
 
-    def load_accounts(self, session):
-        """Load accounts data from CSV."""
-        print("\n1. Loading accounts...")
-
-        # Read CSV
-        accounts_df = pd.read_csv(CLEANED_FILES['accounts'])
-
-        # Convert to Account objects
-        accounts = []
-        for _, row in accounts_df.iterrows():
-            account = Account(
-                account_id=int(row['account_id']),
-                created_at=pd.to_datetime(row['created_at']).date(),
-                primary_language=str(row['primary_language']),
-                profile_count=int(row['profile_count']),
-                account_age_days=int(row['account_age_days'])
+    def upgrade_database(self):
+        """Bring an existing database up to the current schema without reloading data."""
+        self.create_engine_and_session()
+        upgrade_schema(self.engine)
+        logger.info("✓ Database schema is up to date")
+
+    def insert_dataframe(self, conn, model, df):
+        """
+        Append a DataFrame to a model's table.
+
+        Rows are sent with executemany in chunks, without building ORM
+        objects or per-row parameter dicts.
+
+        Args:
+            conn: Connection (inside the load transaction)
+            model: Model class whose table is loaded
+            df: DataFrame with exactly the table's columns
+        """
+        df.to_sql(
+            model.__tablename__,
+            conn,
+            if_exists='append',
+            index=False,
+            chunksize=BULK_INSERT_CHUNKSIZE
+        )
+
+    def read_cleaned_file(self, csv_path, dtype, parse_dates=()):
+        """
+        Read a cleaned dataset in chunks.
+
+        Uses the Parquet copy the cleaner writes next to the CSV when it
+        exists and pyarrow is installed, otherwise the CSV. The cleaner
+        rewrites or removes the Parquet copy on every run, so it is never
+        older than the CSV.
+
+        Args:
+            csv_path: Path to the cleaned CSV file
+            dtype: Types of the columns to read (CSV only; Parquet keeps them)
+            parse_dates: Date columns to read (and parse)
+
+        Returns:
+            Iterator of DataFrame chunks
+        """
+        columns = [*dtype, *parse_dates]
+        csv_path = Path(csv_path)
+        parquet_path = csv_path.with_suffix('.parquet')
+
+        if pq is not None and parquet_path.exists():
+            batches = pq.ParquetFile(parquet_path).iter_batches(
+                batch_size=CSV_CHUNKSIZE, columns=columns
             )
-            accounts.append(account)
+            return (batch.to_pandas() for batch in batches)
+
+        return pd.read_csv(
+            csv_path,
+            usecols=columns,
+            dtype=dtype,
+            parse_dates=list(parse_dates),
+            chunksize=CSV_CHUNKSIZE
+        )
+
+    def load_cleaned_file(self, conn, model, csv_path, prepare, dtype, parse_dates=()):
+        """
+        Stream a cleaned dataset into a table, one chunk at a time.
+
+        Peak memory is bounded by the chunk size rather than the file size.
+
+        Args:
+            conn: Connection (inside the load transaction)
+            model: Model class whose table is loaded
+            csv_path: Path to the cleaned CSV file (see read_cleaned_file)
+            prepare: Function converting a chunk to the table's columns
+            dtype: Types of the columns to read
+            parse_dates: Date columns to read (and parse)
+
+        Returns:
+            Number of rows loaded
+        """
+        count = 0
+        for chunk in self.read_cleaned_file(csv_path, dtype, parse_dates):
+            rows = prepare(chunk)
+            self.insert_dataframe(conn, model, rows)
+            count += len(rows)
+        return count
+
+    @staticmethod
+    def prepare_accounts(accounts_df):
+        """Coerce account CSV columns to the accounts table's types."""
+        return pd.DataFrame({
+            'account_id': accounts_df['account_id'].astype(int),
+            'created_at': pd.to_datetime(accounts_df['created_at']).dt.date,
+            'primary_language': accounts_df['primary_language'].astype(str),
+            'profile_count': accounts_df['profile_count'].astype(int),
+            'account_age_days': accounts_df['account_age_days'].astype(int)
+        })
+
+    @staticmethod
+    def prepare_profiles(profiles_df):
+        """Coerce profile CSV columns to the profiles table's types."""
+        return pd.DataFrame({
+            'profile_id': profiles_df['profile_id'].astype(int),
+            'account_id': profiles_df['account_id'].astype(int),
+            'profile_name': profiles_df['profile_name'].astype(str),
+            'kids_profile': profiles_df['kids_profile'].astype(bool),
+            'age_band': profiles_df['age_band'].astype(str),
+            'age_band_order': profiles_df['age_band_order'].astype(int),
+            'preferred_language': profiles_df['preferred_language'].astype(str),
+            'created_at': pd.to_datetime(profiles_df['created_at']).dt.date,
+            'preferences': profiles_df['preferences'].fillna('').astype(str),
+            'preference_count': profiles_df['preference_count'].astype(int),
+            'account_age_days': profiles_df['account_age_days'].astype(int)
+        })
+
+    @staticmethod
+    def prepare_titles(titles_df):
+        """Coerce title CSV columns to the titles table's types (NaN is stored as NULL)."""
+        return pd.DataFrame({
+            'show_id': titles_df['show_id'].astype(str),
+            'title_name': titles_df['title_name'].astype(str),
+            'category': titles_df['category'].astype(str),
+            'sub_category': titles_df['sub_category'].where(
+                titles_df['sub_category'].isna(), titles_df['sub_category'].astype(str)
+            ),
+            'duration': titles_df['duration'].astype(int),
+            'age_rating': titles_df['age_rating'].astype(str),
+            'type': titles_df['type'].astype(str),
+            'year': titles_df['year'].astype(int),
+            'origin_region': titles_df['origin_region'].astype(str),
+            'language': titles_df['language'].astype(str),
+            'episode_count': titles_df['episode_count'].astype(int),
+            'is_kids_content': titles_df['is_kids_content'].astype(bool),
+            'imdb_rating': titles_df['imdb_rating'].astype(float),
+            'imdb_votes': titles_df['imdb_votes'].astype(float),
+            'has_imdb_data': titles_df['has_imdb_data'].astype(bool),
+            'data_completeness_score': titles_df['data_completeness_score'].astype(float),
+            'popularity_score': titles_df['imdb_votes'].where(
+                titles_df['has_imdb_data'].astype(bool)
+            ).map(popularity_score).astype(float)
+        })
+
+    def load_accounts(self, conn):
+        """Load accounts data from CSV."""
+        logger.info("\n1. Loading accounts...")
 
-        # Bulk insert
-        session.bulk_save_objects(accounts)
-        session.commit()
+        count = self.load_cleaned_file(
+            conn, Account, CLEANED_FILES['accounts'], self.prepare_accounts,
+            CLEANED_ACCOUNTS_DTYPES, parse_dates=['created_at']
+        )
 
-        print(f"   ✓ Loaded {len(accounts)} accounts")
-        return len(accounts)
+        logger.info("   ✓ Loaded %s accounts", count)
+        return count
 
-    def load_profiles(self, session):
+    def load_profiles(self, conn):
         """Load profiles data from CSV."""
-        print("\n2. Loading profiles...")
-
-        # Read CSV
-        profiles_df = pd.read_csv(CLEANED_FILES['profiles'])
-
-        # Convert to Profile objects
-        profiles = []
-        for _, row in profiles_df.iterrows():
-            profile = Profile(
-                profile_id=int(row['profile_id']),
-                account_id=int(row['account_id']),
-                profile_name=str(row['profile_name']),
-                kids_profile=bool(row['kids_profile']),
-                age_band=str(row['age_band']),
-                age_band_order=int(row['age_band_order']),
-                preferred_language=str(row['preferred_language']),
-                created_at=pd.to_datetime(row['created_at']).date(),
-                preferences=str(row['preferences']) if pd.notna(row['preferences']) else '',
-                preference_count=int(row['preference_count']),
-                account_age_days=int(row['account_age_days'])
-            )
-            profiles.append(profile)
+        logger.info("\n2. Loading profiles...")
 
-        # Bulk insert
-        session.bulk_save_objects(profiles)
-        session.commit()
+        count = self.load_cleaned_file(
+            conn, Profile, CLEANED_FILES['profiles'], self.prepare_profiles,
+            CLEANED_PROFILES_DTYPES, parse_dates=['created_at']
+        )
 
-        print(f"   ✓ Loaded {len(profiles)} profiles")
-        return len(profiles)
+        logger.info("   ✓ Loaded %s profiles", count)
+        return count
 
-    def load_titles(self, session):
+    def load_titles(self, conn):
         """Load titles data from CSV."""
-        print("\n3. Loading titles...")
-
-        # Read CSV
-        titles_df = pd.read_csv(CLEANED_FILES['titles'])
-
-        # Convert to Title objects
-        titles = []
-        for _, row in titles_df.iterrows():
-            title = Title(
-                show_id=str(row['show_id']),
-                title_name=str(row['title_name']),
-                category=str(row['category']),
-                sub_category=str(row['sub_category']) if pd.notna(row['sub_category']) else None,
-                duration=int(row['duration']),
-                age_rating=str(row['age_rating']),
-                type=str(row['type']),
-                year=int(row['year']),
-                origin_region=str(row['origin_region']),
-                language=str(row['language']),
-                episode_count=int(row['episode_count']),
-                is_kids_content=bool(row['is_kids_content']),
-                imdb_rating=float(row['imdb_rating']) if pd.notna(row['imdb_rating']) else None,
-                imdb_votes=float(row['imdb_votes']) if pd.notna(row['imdb_votes']) else None,
-                has_imdb_data=bool(row['has_imdb_data']),
-                data_completeness_score=float(row['data_completeness_score'])
-            )
-            titles.append(title)
+        logger.info("\n3. Loading titles...")
 
-        # Bulk insert
-        session.bulk_save_objects(titles)
-        session.commit()
+        count = self.load_cleaned_file(
+            conn, Title, CLEANED_FILES['titles'], self.prepare_titles,
+            CLEANED_TITLES_DTYPES
+        )
 
-        print(f"   ✓ Loaded {len(titles)} titles")
-        return len(titles)
+        logger.info("   ✓ Loaded %s titles", count)
+        return count
 
     def load_all_data(self):
         """Load all data from CSV files into database."""
-        print("\n" + "=" * 80)
-        print("LOADING DATA INTO DATABASE")
-        print("=" * 80)
-
-        session = self.Session()
+        logger.info("\n" + "=" * 80)
+        logger.info("LOADING DATA INTO DATABASE")
+        logger.info("=" * 80)
 
         try:
-            # Load data in order (accounts first due to foreign keys)
-            accounts_count = self.load_accounts(session)
-            profiles_count = self.load_profiles(session)
-            titles_count = self.load_titles(session)
-
-            print("\n" + "=" * 80)
-            print("✓ DATA LOADING COMPLETE")
-            print("=" * 80)
-            print(f"\nTotal records loaded:")
-            print(f"  - Accounts: {accounts_count}")
-            print(f"  - Profiles: {profiles_count}")
-            print(f"  - Titles: {titles_count}")
+            # Load everything in one transaction, with syncing relaxed for
+            # the duration (a failed load is simply rerun)
+            with self.engine.connect() as conn:
+                for pragma in BULK_LOAD_PRAGMAS:
+                    conn.exec_driver_sql(pragma)
+                conn.commit()
+
+                with conn.begin():
+                    # Indexes are built once after the load instead of
+                    # being updated row by row
+                    self.drop_indexes(conn)
+
+                    # Load data in order (accounts first due to foreign keys)
+                    accounts_count = self.load_accounts(conn)
+                    profiles_count = self.load_profiles(conn)
+                    titles_count = self.load_titles(conn)
+
+                    self.create_indexes(conn)
+
+                for pragma in AFTER_LOAD_PRAGMAS:
+                    conn.exec_driver_sql(pragma)
+                conn.commit()
+
+            logger.info("\n" + "=" * 80)
+            logger.info("✓ DATA LOADING COMPLETE")
+            logger.info("=" * 80)
+            logger.info("\nTotal records loaded:")
+            logger.info("  - Accounts: %s", accounts_count)
+            logger.info("  - Profiles: %s", profiles_count)
+            logger.info("  - Titles: %s", titles_count)
 
             return {
                 'accounts': accounts_count,
@@ -219,77 +447,98 @@ class DatabaseManager:
             }
 
         except Exception as e:
-            session.rollback()
-            print(f"\n✗ Error loading data: {e}")
+            logger.error("\n✗ Error loading data: %s", e)
             raise
-        finally:
-            session.close()
+
+    def drop_indexes(self, conn):
+        """Drop the secondary indexes of all tables."""
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.drop(conn, checkfirst=True)
+
+    def create_indexes(self, conn):
+        """Create the secondary indexes of all tables."""
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+    def create_search_index(self):
+        """
+        Build the FTS5 full-text index used for title search.
+
+        The index is an external-content table over titles.title_name, so it
+        stores only the tokenized terms and is rebuilt from the titles table.
+        Triggers keep it in sync when titles are added, renamed or removed
+        after the build.
+        """
+        with self.engine.connect() as conn:
+            for trigger in SEARCH_INDEX_TRIGGERS:
+                conn.execute(text(f'DROP TRIGGER IF EXISTS {trigger}'))
+            conn.execute(text('DROP TABLE IF EXISTS titles_fts'))
+            conn.execute(text(
+                "CREATE VIRTUAL TABLE titles_fts USING fts5("
+                "title_name, content='titles', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            ))
+            conn.execute(text("INSERT INTO titles_fts(titles_fts) VALUES ('rebuild')"))
+            for sql in SEARCH_INDEX_TRIGGERS.values():
+                conn.execute(text(sql))
+            conn.commit()
+
+        logger.info("\n✓ Title search index built")
+
+    def build_top_rated(self):
+        """Rebuild the precomputed top rated rankings from the titles table."""
+        with self.engine.connect() as conn:
+            conn.execute(text('DELETE FROM top_rated'))
+            count = conn.execute(text(TOP_RATED_SQL)).rowcount
+            conn.commit()
+
+        logger.info("\n✓ Top rated rankings built (%s rows)", count)
+
+    def analyze_database(self):
+        """Refresh SQLite query planner statistics after loading data."""
+        with self.engine.connect() as conn:
+            conn.execute(text('ANALYZE'))
+            conn.commit()
+
+        logger.info("\n✓ Query planner statistics updated")
 
     def verify_data(self):
         """Verify data was loaded correctly."""
-        print("\n" + "=" * 80)
-        print("VERIFYING DATABASE")
-        print("=" * 80)
-
-        session = self.Session()
+        logger.info("\n" + "=" * 80)
+        logger.info("VERIFYING DATABASE")
+        logger.info("=" * 80)
 
         try:
-            # Count records
-            accounts_count = session.query(Account).count()
-            profiles_count = session.query(Profile).count()
-            titles_count = session.query(Title).count()
+            # All counts in one round trip
+            with self.engine.connect() as conn:
+                counts = conn.execute(text(VERIFY_COUNTS_SQL)).one()
 
-            print(f"\n✓ Database verification:")
-            print(f"  - Accounts: {accounts_count}")
-            print(f"  - Profiles: {profiles_count}")
-            print(f"  - Titles: {titles_count}")
+            logger.info("\n✓ Database verification:")
+            logger.info("  - Accounts: %s", counts.accounts)
+            logger.info("  - Profiles: %s", counts.profiles)
+            logger.info("  - Titles: %s", counts.titles)
 
             # Test some queries
-            print("\n✓ Testing sample queries:")
-
-            # Query 1: Get all profiles for account 1
-            account_profiles = session.query(Profile).filter(
-                Profile.account_id == 1
-            ).all()
-            print(f"  - Profiles for account 1: {len(account_profiles)}")
-
-            # Query 2: Get kids content
-            kids_titles = session.query(Title).filter(
-                Title.is_kids_content == True
-            ).count()
-            print(f"  - Kids content titles: {kids_titles}")
-
-            # Query 3: Get titles by age rating
-            pg_titles = session.query(Title).filter(
-                Title.age_rating == 'PG'
-            ).count()
-            print(f"  - PG rated titles: {pg_titles}")
-
-            # Query 4: Get titles by language
-            english_titles = session.query(Title).filter(
-                Title.language == 'en'
-            ).count()
-            print(f"  - English titles: {english_titles}")
-
-            # Query 5: Get titles with IMDB ratings
-            rated_titles = session.query(Title).filter(
-                Title.has_imdb_data == True
-            ).count()
-            print(f"  - Titles with IMDB ratings: {rated_titles}")
-
-            print("\n✓ All queries executed successfully")
+            logger.info("\n✓ Testing sample queries:")
+            logger.info("  - Profiles for account 1: %s", counts.account_profiles)
+            logger.info("  - Kids content titles: %s", counts.kids_titles)
+            logger.info("  - PG rated titles: %s", counts.pg_titles)
+            logger.info("  - English titles: %s", counts.english_titles)
+            logger.info("  - Titles with IMDB ratings: %s", counts.rated_titles)
+
+            logger.info("\n✓ All queries executed successfully")
 
         except Exception as e:
-            print(f"\n✗ Verification error: {e}")
+            logger.error("\n✗ Verification error: %s", e)
             raise
-        finally:
-            session.close()
 
     def generate_report(self, load_stats):
         """Generate database setup report."""
-        print("\n" + "=" * 80)
-        print("GENERATING SETUP REPORT")
-        print("=" * 80)
+        logger.info("\n" + "=" * 80)
+        logger.info("GENERATING SETUP REPORT")
+        logger.info("=" * 80)
 
         report = {
             'timestamp': datetime.now().isoformat(),
@@ -310,14 +559,14 @@ class DatabaseManager:
             for table, count in report['records_loaded'].items():
                 f.write(f"  - {table.capitalize()}: {count}\n")
 
-        print(f"\n✓ Report saved: {report_path}")
+        logger.info("\n✓ Report saved: %s", report_path)
 
     def run(self, drop_existing=False):
         """Execute the complete database setup pipeline."""
-        print("\n" + "=" * 80)
-        print("STREAMLY DATABASE SETUP PIPELINE")
-        print("=" * 80)
-        print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info("\n" + "=" * 80)
+        logger.info("STREAMLY DATABASE SETUP PIPELINE")
+        logger.info("=" * 80)
+        logger.info("Started at: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
 
         try:
             # Create engine and session
@@ -328,6 +577,12 @@ class DatabaseManager:
 
             # Load data
             load_stats = self.load_all_data()
+            self.create_search_index()
+            self.build_top_rated()
+            self.analyze_database()
+
+            # Invalidate in-process caches built from the previous data
+            bump_data_version()
 
             # Verify
             self.verify_data()
@@ -335,16 +590,16 @@ class DatabaseManager:
             # Generate report
             self.generate_report(load_stats)
 
-            print("\n" + "=" * 80)
-            print("✅ DATABASE SETUP COMPLETE")
-            print("=" * 80)
-            print(f"Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"\nDatabase location: {self.db_path}")
+            logger.info("\n" + "=" * 80)
+            logger.info("✅ DATABASE SETUP COMPLETE")
+            logger.info("=" * 80)
+            logger.info("Completed at: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            logger.info("\nDatabase location: %s", self.db_path)
 
             return True
 
         except Exception as e:
-            print(f"\n✗ Database setup failed: {e}")
+            logger.error("\n✗ Database setup failed: %s", e)
             import traceback
             traceback.print_exc()
             return False
@@ -352,6 +607,8 @@ class DatabaseManager:
 
 def main():
     """Main entry point."""
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+
     import argparse
 
     parser = argparse.ArgumentParser(description='Setup Streamly database')
@@ -0,0 +1,44 @@
+"""
+Schema Upgrade Module for Streamly Recommendation System
+
+This module brings databases built by earlier versions up to the current
+schema, so an existing data/streamly.db keeps working without a rebuild.
+It is run by the database setup, never by the API's read path.
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import OperationalError
+
+from src.recommendation.popularity import popularity_score
+
+
+def upgrade_schema(engine):
+    """
+    Add columns missing from a database built by an earlier version.
+
+    titles.popularity_score is added and filled in from imdb_votes. Does
+    nothing if the tables haven't been created yet or are already current.
+    """
+    inspector = inspect(engine)
+    if not inspector.has_table('titles'):
+        return
+
+    columns = {column['name'] for column in inspector.get_columns('titles')}
+    if 'popularity_score' in columns:
+        return
+
+    try:
+        with engine.begin() as conn:
+            conn.execute(text('ALTER TABLE titles ADD COLUMN popularity_score FLOAT'))
+            rows = conn.execute(text(
+                'SELECT id, imdb_votes FROM titles WHERE has_imdb_data = 1'
+            )).all()
+            if rows:
+                conn.execute(
+                    text('UPDATE titles SET popularity_score = :score WHERE id = :id'),
+                    [{'id': row.id, 'score': popularity_score(row.imdb_votes)} for row in rows]
+                )
+    except OperationalError as e:
+        # Another process (e.g. the reloader) added the column first
+        if 'duplicate column' not in str(e):
+            raise
@@ -5,7 +5,7 @@ This module defines the SQLAlchemy ORM models for the database schema.
 """
 
 from sqlalchemy import (
-    Column, Integer, String, Boolean, Float, Date, ForeignKey, Text, Table
+    Column, Integer, String, Boolean, Float, Date, ForeignKey, Text, Table, Index, text
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -53,6 +53,7 @@ class Profile(Base):
 
     # Indexes
     __table_args__ = (
+        Index('ix_profile_account', 'account_id'),
         {'sqlite_autoincrement': True}
     )
 
@@ -82,9 +83,25 @@ class Title(Base):
     imdb_votes = Column(Float, nullable=True)
     has_imdb_data = Column(Boolean, nullable=False, default=False, index=True)
     data_completeness_score = Column(Float, nullable=False, default=0.0)
+    popularity_score = Column(Float, nullable=True)  # From imdb_votes, set at load
 
-    # Indexes for common queries
+    # Indexes for common queries (filter column + sort column)
     __table_args__ = (
+        Index('ix_title_kids_rating', 'is_kids_content', 'imdb_rating'),
+        Index('ix_title_cat_rating', 'category', 'imdb_rating'),
+        Index('ix_title_type_year', 'type', 'year'),
+        Index('ix_title_lang_rating', 'language', 'imdb_rating'),
+        # Profile title lists: kids filter, then the has_imdb_data/imdb_rating
+        # sort order, with age_rating checked from the index
+        Index(
+            'ix_title_rec', 'is_kids_content', 'has_imdb_data', 'imdb_rating', 'age_rating'
+        ),
+        Index('ix_title_imdb_order', 'has_imdb_data', 'imdb_rating'),
+        # Partial index: only rated titles, in rating order (top rated lists)
+        Index(
+            'ix_title_rated', 'imdb_rating', 'imdb_votes',
+            sqlite_where=text('has_imdb_data = 1')
+        ),
         {'sqlite_autoincrement': True}
     )
 
@@ -109,3 +126,22 @@ class Title(Base):
             'imdb_rating': self.imdb_rating,
             'imdb_votes': self.imdb_votes
         }
+
+
+class TopRated(Base):
+    """
+    Precomputed IMDB ranking of rated titles, rebuilt when data is loaded.
+
+    Each scope ('global', or a category name) holds every rated title in
+    ranking order, so top rated lists are read in rank order instead of
+    being sorted per request.
+    """
+
+    __tablename__ = 'top_rated'
+
+    scope = Column(String(100), primary_key=True)
+    rank = Column(Integer, primary_key=True)
+    show_id = Column(String(50), ForeignKey('titles.show_id'), nullable=False)
+
+    def __repr__(self):
+        return f"<TopRated(scope='{self.scope}', rank={self.rank}, show_id='{self.show_id}')>"
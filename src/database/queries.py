@@ -4,17 +4,26 @@ Database Query Utilities for Streamly Recommendation System
 This module provides common database queries for the recommendation system.
 """
 
+import os
+import re
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from sqlalchemy import create_engine, and_, or_, func
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import (
+    create_engine, event, lambda_stmt, select, text, and_, or_, case, distinct, func
+)
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import raiseload, scoped_session, selectinload, sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from src.database.models import Account, Profile, Title
+from src.database.cache import TTLCache
+from src.database.models import Account, Profile, Title, TopRated
+from src.recommendation.age import age_ratings_for
 
 # Import config with fallback
 try:
@@ -22,6 +31,117 @@ try:
 except ImportError:
     DATABASE_PATH = project_root / 'data' / 'streamly.db'
 
+# SQLite settings applied to every new connection: WAL lets readers run
+# alongside a writer, and the larger cache / memory-mapped I/O keep hot
+# pages in memory instead of going through read() syscalls
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-65536',  # 64 MB
+    'PRAGMA mmap_size=268435456',  # 256 MB
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_PRAGMAS to a newly opened connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+# Connection pool: enough connections for the request threads plus the
+# dashboard worker pool. LIFO checkout keeps reusing the most recent (warm)
+# connections, whose page cache and mmap are already populated.
+POOL_SIZE = 10
+POOL_MAX_OVERFLOW = 20
+
+
+# Set DEBUG_N_PLUS_1=1 to make lazy relationship loads raise instead of
+# quietly issuing one query per object (relationships a caller needs must
+# then be loaded eagerly, e.g. load_account=True)
+DEBUG_N_PLUS_1 = bool(os.environ.get('DEBUG_N_PLUS_1'))
+
+
+def _raise_on_lazy_load(orm_execute_state):
+    """Add raiseload('*') to ORM SELECTs (used when DEBUG_N_PLUS_1 is set)."""
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload('*'))
+
+
+# Engines and thread-local session registries, one per database file.
+# Shared by every DatabaseQueries instance so pooled connections are reused.
+_ENGINES = {}
+
+
+def _get_engine(db_path):
+    """
+    Get (or create) the pooled engine and session registry for a database.
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        Tuple of (engine, scoped session factory)
+    """
+    key = str(db_path)
+    if key not in _ENGINES:
+        engine = create_engine(
+            f'sqlite:///{db_path}',
+            echo=False,
+            poolclass=QueuePool,
+            pool_size=POOL_SIZE,
+            max_overflow=POOL_MAX_OVERFLOW,
+            pool_use_lifo=True,
+            # Pooled connections are handed to whichever request thread needs one
+            connect_args={'check_same_thread': False}
+        )
+        event.listen(engine, 'connect', _set_sqlite_pragmas)
+        session_maker = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+        if DEBUG_N_PLUS_1:
+            event.listen(session_maker, 'do_orm_execute', _raise_on_lazy_load)
+        session_factory = scoped_session(session_maker)
+        _ENGINES[key] = (engine, session_factory)
+    return _ENGINES[key]
+
+
+# Rows fetched (and turned into objects) at a time by the full-table scans
+QUERY_BATCH_SIZE = 1000
+
+
+# Results of the get_titles_by_* lookups as tuples of TITLE_ATTRS values,
+# shared by all instances (entries are also dropped when the database is
+# reloaded)
+TITLE_ATTRS = tuple(attr.key for attr in Title.__mapper__.column_attrs)
+_TITLE_LIST_CACHE = TTLCache(maxsize=256, ttl=300)
+
+
+# Full-text title search, best matches first
+FTS_SEARCH_SQL = (
+    'SELECT titles.* FROM titles_fts '
+    'JOIN titles ON titles.id = titles_fts.rowid '
+    'WHERE titles_fts MATCH :query '
+    'ORDER BY titles_fts.rank LIMIT :limit'
+)
+
+
+def _fts_match_query(search_term):
+    """
+    Convert a search term into an FTS5 MATCH expression.
+
+    Each word is quoted (so FTS5 operators in user input are taken literally)
+    and matched as a prefix, e.g. 'star wa' -> '"star"* "wa"*'.
+    """
+    words = re.findall(r'\w+', search_term)
+    return ' '.join(f'"{word}"*' for word in words)
+
 
 class DatabaseQueries:
     """Provides common database query methods."""
@@ -34,155 +154,184 @@ class DatabaseQueries:
             db_path: Path to SQLite database file. Defaults to config setting.
         """
         self.db_path = db_path or DATABASE_PATH
-        self.engine = create_engine(f'sqlite:///{self.db_path}', echo=False)
-        self.Session = sessionmaker(bind=self.engine)
+        self.engine, self.Session = _get_engine(self.db_path)
 
     def get_session(self):
-        """Get a new database session."""
+        """Get the database session for the current thread."""
         return self.Session()
 
-    # Account Queries
+    @contextmanager
+    def session_scope(self):
+        """
+        Provide a session that is closed when the block exits.
 
-    def get_account_by_id(self, account_id):
-        """Get account by ID."""
-        session = self.get_session()
+        Usage:
+            with db_queries.session_scope() as session:
+                session.query(Title)...
+        """
+        session = self.Session()
         try:
-            return session.query(Account).filter(
-                Account.account_id == account_id
-            ).first()
+            yield session
         finally:
             session.close()
 
+    def remove_session(self):
+        """Discard the session bound to the current thread."""
+        self.Session.remove()
+
+    # Account Queries
+    # (point lookups use lambda_stmt, so the statement is built and its cache
+    # key computed once rather than on every call)
+
+    def get_account_by_id(self, account_id):
+        """Get account by ID."""
+        with self.session_scope() as session:
+            return session.execute(lambda_stmt(
+                lambda: select(Account).where(Account.account_id == account_id).limit(1)
+            )).scalars().first()
+
     def get_all_accounts(self):
         """Get all accounts."""
-        session = self.get_session()
-        try:
-            return session.query(Account).all()
-        finally:
-            session.close()
+        with self.session_scope() as session:
+            return list(session.query(Account).yield_per(QUERY_BATCH_SIZE))
 
     # Profile Queries
 
-    def get_profile_by_id(self, profile_id):
-        """Get profile by ID."""
-        session = self.get_session()
-        try:
-            return session.query(Profile).filter(
-                Profile.profile_id == profile_id
-            ).first()
-        finally:
-            session.close()
+    def get_profile_by_id(self, profile_id, load_account=False):
+        """
+        Get profile by ID.
 
-    def get_profiles_by_account(self, account_id):
-        """Get all profiles for a given account."""
-        session = self.get_session()
-        try:
-            return session.query(Profile).filter(
+        Args:
+            profile_id: Profile ID
+            load_account: Also load profile.account (in a second query)
+        """
+        with self.session_scope() as session:
+            if load_account:
+                stmt = lambda_stmt(
+                    lambda: select(Profile).options(selectinload(Profile.account))
+                    .where(Profile.profile_id == profile_id).limit(1)
+                )
+            else:
+                stmt = lambda_stmt(
+                    lambda: select(Profile).where(Profile.profile_id == profile_id).limit(1)
+                )
+            return session.execute(stmt).scalars().first()
+
+    def get_profiles_by_account(self, account_id, load_account=False):
+        """
+        Get all profiles for a given account.
+
+        Args:
+            account_id: Account ID
+            load_account: Also load each profile's account (one extra query
+                in total, not one per profile)
+        """
+        with self.session_scope() as session:
+            query = session.query(Profile).filter(
                 Profile.account_id == account_id
-            ).all()
-        finally:
-            session.close()
+            )
+            if load_account:
+                query = query.options(selectinload(Profile.account))
+            return query.all()
 
     def get_kids_profiles(self):
         """Get all kids profiles."""
-        session = self.get_session()
-        try:
-            return session.query(Profile).filter(
+        with self.session_scope() as session:
+            return list(session.query(Profile).filter(
                 Profile.kids_profile == True
-            ).all()
-        finally:
-            session.close()
+            ).yield_per(QUERY_BATCH_SIZE))
 
     # Title Queries
 
+    def _get_cached_titles(self, column, value):
+        """
+        Get all titles whose column equals value, through the shared TTL cache.
+
+        The cache holds plain row tuples, never ORM objects; each call builds
+        its own (unattached) Title objects from them.
+        """
+        key = (str(self.db_path), column.key, value)
+        rows = _TITLE_LIST_CACHE.get(key)
+        if rows is None:
+            stmt = select(*(getattr(Title, name) for name in TITLE_ATTRS)).where(column == value)
+            with self.session_scope() as session:
+                rows = tuple(
+                    tuple(row) for row in session.execute(stmt).yield_per(QUERY_BATCH_SIZE)
+                )
+            _TITLE_LIST_CACHE.set(key, rows)
+        return [Title(**dict(zip(TITLE_ATTRS, row))) for row in rows]
+
     def get_title_by_show_id(self, show_id):
         """Get title by show_id."""
-        session = self.get_session()
-        try:
-            return session.query(Title).filter(
-                Title.show_id == show_id
-            ).first()
-        finally:
-            session.close()
+        with self.session_scope() as session:
+            return session.execute(lambda_stmt(
+                lambda: select(Title).where(Title.show_id == show_id).limit(1)
+            )).scalars().first()
 
     def get_titles_by_age_rating(self, age_rating):
         """Get titles by age rating."""
-        session = self.get_session()
-        try:
-            return session.query(Title).filter(
-                Title.age_rating == age_rating
-            ).all()
-        finally:
-            session.close()
+        return self._get_cached_titles(Title.age_rating, age_rating)
 
     def get_kids_content(self):
         """Get all kids content."""
-        session = self.get_session()
-        try:
-            return session.query(Title).filter(
+        with self.session_scope() as session:
+            return list(session.query(Title).filter(
                 Title.is_kids_content == True
-            ).all()
-        finally:
-            session.close()
+            ).yield_per(QUERY_BATCH_SIZE))
 
     def get_titles_by_category(self, category):
         """Get titles by category."""
-        session = self.get_session()
-        try:
-            return session.query(Title).filter(
-                Title.category == category
-            ).all()
-        finally:
-            session.close()
+        return self._get_cached_titles(Title.category, category)
 
     def get_titles_by_language(self, language):
         """Get titles by language."""
-        session = self.get_session()
-        try:
-            return session.query(Title).filter(
-                Title.language == language
-            ).all()
-        finally:
-            session.close()
+        return self._get_cached_titles(Title.language, language)
 
     def get_titles_by_region(self, region):
         """Get titles by origin region."""
-        session = self.get_session()
-        try:
-            return session.query(Title).filter(
-                Title.origin_region == region
-            ).all()
-        finally:
-            session.close()
+        return self._get_cached_titles(Title.origin_region, region)
 
     def get_titles_by_type(self, content_type):
         """Get titles by type (Movie or Series)."""
-        session = self.get_session()
-        try:
-            return session.query(Title).filter(
-                Title.type == content_type
-            ).all()
-        finally:
-            session.close()
+        return self._get_cached_titles(Title.type, content_type)
 
-    def get_top_rated_titles(self, limit=10, min_votes=10):
+    def get_top_rated_titles(self, limit=10, min_votes=10, category=None):
         """
         Get top rated titles by IMDB rating.
 
+        Reads the rankings precomputed in top_rated at load time, falling
+        back to sorting the titles table if they haven't been built.
+
         Args:
             limit: Number of titles to return
             min_votes: Minimum number of IMDB votes required
+            category: Only rank titles in this category (default: all titles)
         """
-        session = self.get_session()
-        try:
-            return session.query(Title).filter(
+        with self.session_scope() as session:
+            try:
+                return session.query(Title).join(
+                    TopRated, TopRated.show_id == Title.show_id
+                ).filter(
+                    TopRated.scope == (category or 'global'),
+                    Title.imdb_votes >= min_votes
+                ).order_by(TopRated.rank).limit(limit).all()
+            except OperationalError:
+                # No top_rated table in this database
+                session.rollback()
+
+            query = session.query(Title).filter(
                 and_(
                     Title.has_imdb_data == True,
                     Title.imdb_votes >= min_votes
                 )
-            ).order_by(Title.imdb_rating.desc()).limit(limit).all()
-        finally:
-            session.close()
+            )
+            if category:
+                query = query.filter(Title.category == category)
+
+            return query.order_by(
+                # Equal ratings: more votes first (matches ix_title_rated)
+                Title.imdb_rating.desc(), Title.imdb_votes.desc()
+            ).limit(limit).all()
 
     def get_titles_for_profile(self, profile_id, limit=50):
         """
@@ -192,8 +341,7 @@ class DatabaseQueries:
             profile_id: Profile ID
             limit: Maximum number of titles to return
         """
-        session = self.get_session()
-        try:
+        with self.session_scope() as session:
             # Get profile
             profile = session.query(Profile).filter(
                 Profile.profile_id == profile_id
@@ -210,11 +358,7 @@ class DatabaseQueries:
                 query = query.filter(Title.is_kids_content == True)
 
             # Filter by age rating
-            age_ratings = self._get_appropriate_age_ratings(
-                profile.age_band, 
-                profile.kids_profile
-            )
-            query = query.filter(Title.age_rating.in_(age_ratings))
+            query = query.filter(Title.age_rating.in_(age_ratings_for(profile)))
 
             # Prefer titles with IMDB data
             query = query.order_by(
@@ -224,72 +368,82 @@ class DatabaseQueries:
 
             return query.limit(limit).all()
 
-        finally:
-            session.close()
-
-    def _get_appropriate_age_ratings(self, age_band, is_kids):
-        """Get appropriate age ratings for a profile."""
-        if is_kids:
-            if age_band == '<13':
-                return ['G', 'PG']
-            elif age_band == '13-17':
-                return ['G', 'PG', '13+']
-
-        # Adult profiles
-        if age_band in ['18-24', '25-34', '35-49', '50+']:
-            return ['G', 'PG', '13+', '16+', '18+']
-
-        return ['G', 'PG', '13+']
-
     def search_titles(self, search_term, limit=20):
         """
         Search titles by name.
 
+        Uses the titles_fts full-text index first: every word in the search
+        term matches the start of a word in the title ('night' finds 'Night
+        Moves' and 'Nightcrawler'), best matches first. If that finds fewer
+        than limit titles, the rest are filled with substring matches from a
+        LIKE scan ('night' also finds 'Midnight Run'), which is also used on
+        its own if the index hasn't been built.
+
         Args:
             search_term: Search term
             limit: Maximum number of results
         """
-        session = self.get_session()
-        try:
-            return session.query(Title).filter(
-                Title.title_name.like(f'%{search_term}%')
-            ).limit(limit).all()
-        finally:
-            session.close()
+        match_query = _fts_match_query(search_term)
+
+        with self.session_scope() as session:
+            titles = []
+            if match_query:
+                try:
+                    titles = session.query(Title).from_statement(
+                        text(FTS_SEARCH_SQL)
+                    ).params(query=match_query, limit=limit).all()
+                except OperationalError:
+                    # No search index in this database
+                    session.rollback()
+
+            if len(titles) < limit:
+                titles += session.query(Title).filter(
+                    Title.title_name.like(f'%{search_term}%'),
+                    Title.id.notin_([title.id for title in titles])
+                ).limit(limit - len(titles)).all()
+
+            return titles
 
     def get_statistics(self):
         """Get database statistics."""
-        session = self.get_session()
-        try:
+        with self.session_scope() as session:
+            # One aggregate query per table (COUNT of a CASE counts matches)
+            total_accounts = session.query(func.count(Account.account_id)).scalar()
+
+            profile_stats = session.query(
+                func.count(Profile.profile_id).label('total'),
+                func.count(case((Profile.kids_profile == True, 1))).label('kids')
+            ).one()
+
+            title_stats = session.query(
+                func.count(Title.id).label('total'),
+                func.count(case((Title.is_kids_content == True, 1))).label('kids'),
+                func.count(case((Title.type == 'Movie', 1))).label('movies'),
+                func.count(case((Title.type == 'Series', 1))).label('series'),
+                func.count(case((Title.has_imdb_data == True, 1))).label('rated'),
+                func.avg(
+                    case((Title.has_imdb_data == True, Title.imdb_rating))
+                ).label('avg_rating'),
+                func.count(distinct(Title.category)).label('categories'),
+                func.count(distinct(Title.language)).label('languages'),
+                func.count(distinct(Title.origin_region)).label('regions')
+            ).one()
+
             stats = {
-                'total_accounts': session.query(Account).count(),
-                'total_profiles': session.query(Profile).count(),
-                'total_titles': session.query(Title).count(),
-                'kids_profiles': session.query(Profile).filter(
-                    Profile.kids_profile == True
-                ).count(),
-                'kids_content': session.query(Title).filter(
-                    Title.is_kids_content == True
-                ).count(),
-                'movies': session.query(Title).filter(
-                    Title.type == 'Movie'
-                ).count(),
-                'series': session.query(Title).filter(
-                    Title.type == 'Series'
-                ).count(),
-                'titles_with_ratings': session.query(Title).filter(
-                    Title.has_imdb_data == True
-                ).count(),
-                'avg_imdb_rating': session.query(
-                    func.avg(Title.imdb_rating)
-                ).filter(Title.has_imdb_data == True).scalar(),
-                'unique_categories': session.query(Title.category).distinct().count(),
-                'unique_languages': session.query(Title.language).distinct().count(),
-                'unique_regions': session.query(Title.origin_region).distinct().count()
+                'total_accounts': total_accounts,
+                'total_profiles': profile_stats.total,
+                'total_titles': title_stats.total,
+                'kids_profiles': profile_stats.kids,
+                'kids_content': title_stats.kids,
+                'movies': title_stats.movies,
+                'series': title_stats.series,
+                'titles_with_ratings': title_stats.rated,
+                'avg_imdb_rating': title_stats.avg_rating,
+                'unique_categories': title_stats.categories,
+                'unique_languages': title_stats.languages,
+                'unique_regions': title_stats.regions
             }
             return stats
-        finally:
-            session.close()
 
 
 def main():
@@ -0,0 +1,31 @@
+"""
+Age Rating Rules for Streamly Recommendation System
+
+This module defines which age ratings each profile may watch. It is shared
+by the database queries and the recommendation engine.
+"""
+
+from typing import Dict, Tuple
+
+ALL_AGE_RATINGS = ('G', 'PG', '13+', '16+', '18+')
+DEFAULT_AGE_RATINGS = ('G', 'PG', '13+')
+
+# Age ratings each profile may watch, by (kids profile, age band). Kids
+# profiles in an adult age band get the adult ratings; anything not listed
+# gets DEFAULT_AGE_RATINGS.
+AGE_RATINGS: Dict[Tuple[bool, str], Tuple[str, ...]] = {
+    (True, '<13'): ('G', 'PG'),
+    (True, '13-17'): DEFAULT_AGE_RATINGS,
+    **{
+        (is_kids, age_band): ALL_AGE_RATINGS
+        for is_kids in (True, False)
+        for age_band in ('18-24', '25-34', '35-49', '50+')
+    }
+}
+
+
+def age_ratings_for(profile) -> Tuple[str, ...]:
+    """Get the age ratings a profile may watch."""
+    return AGE_RATINGS.get(
+        (bool(profile.kids_profile), profile.age_band), DEFAULT_AGE_RATINGS
+    )
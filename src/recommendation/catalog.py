@@ -0,0 +1,130 @@
+"""
+Title Catalog for Streamly Recommendation System
+
+This module keeps the title columns used for scoring in memory as NumPy
+arrays, so the recommendation engine can score every title at once instead
+of looping over ORM objects.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+from sqlalchemy import select
+
+from src.database.models import Title
+
+# Columns loaded into the catalog (also the fields of each row)
+CATALOG_COLUMNS = (
+    Title.id,
+    Title.show_id,
+    Title.title_name,
+    Title.category,
+    Title.sub_category,
+    Title.year,
+    Title.type,
+    Title.duration,
+    Title.age_rating,
+    Title.language,
+    Title.imdb_rating,
+    Title.imdb_votes,
+    Title.popularity_score,
+    Title.has_imdb_data,
+    Title.is_kids_content
+)
+
+
+def _factorize(values):
+    """
+    Encode values as integer codes, using the narrowest unsigned dtype.
+
+    With a few dozen distinct values the codes fit in one byte per title,
+    so gathering per-value scores reads far less memory than object arrays.
+
+    Returns:
+        Tuple of (codes array, index of the first row holding each code)
+    """
+    code_by_value = {}
+    first_rows = []
+    codes = []
+    for i, value in enumerate(values):
+        code = code_by_value.get(value)
+        if code is None:
+            code = code_by_value[value] = len(first_rows)
+            first_rows.append(i)
+        codes.append(code)
+
+    dtype = np.min_scalar_type(max(len(first_rows) - 1, 0))
+    return np.array(codes, dtype=dtype), first_rows
+
+
+class TitleCatalog:
+    """
+    In-memory, column-oriented copy of the titles table.
+
+    Rows are kept in primary key order. Columns that profile-dependent
+    scores are derived from (category/sub-category and language) are also
+    stored as integer codes, so a score can be computed once per distinct
+    value and gathered for every title. Age ratings and types are coded the
+    same way for candidate filtering and similarity scoring.
+    """
+
+    def __init__(self, rows):
+        """
+        Build the catalog.
+
+        Args:
+            rows: Title rows with the CATALOG_COLUMNS fields, in id order
+        """
+        self.rows = rows
+
+        # Transpose once into plain column tuples instead of looking up
+        # attributes on every row for every column
+        columns = dict(zip(
+            (column.key for column in CATALOG_COLUMNS),
+            zip(*rows) if rows else [()] * len(CATALOG_COLUMNS)
+        ))
+
+        self.ids = np.array(columns['id'], dtype=np.int64)
+        self.show_ids = list(columns['show_id'])
+        self.years = np.array(columns['year'], dtype=np.int64)
+        self.imdb_ratings = np.array(columns['imdb_rating'], dtype=np.float64)  # NaN if unrated
+        self.type_codes, _ = _factorize(columns['type'])
+        self.index_by_show_id = {show_id: i for i, show_id in enumerate(self.show_ids)}
+
+        self.age_rating_codes, age_rating_rows = _factorize(columns['age_rating'])
+        self.age_rating_values = [columns['age_rating'][i] for i in age_rating_rows]
+        self.is_kids_content = np.array(columns['is_kids_content'], dtype=bool)
+
+        # Category/sub-category pairs and languages, with one example row each
+        self.genre_codes, genre_rows = _factorize(
+            zip(columns['category'], columns['sub_category'])
+        )
+        self.genre_examples = [rows[i] for i in genre_rows]
+
+        self.language_codes, language_rows = _factorize(columns['language'])
+        self.language_examples = [rows[i] for i in language_rows]
+
+        # Row positions of each category's titles (in id order)
+        positions_by_category = {}
+        for i, category in enumerate(columns['category']):
+            positions_by_category.setdefault(category, []).append(i)
+        self.positions_by_category = {
+            category: np.array(positions, dtype=np.int64)
+            for category, positions in positions_by_category.items()
+        }
+
+    @classmethod
+    def load(cls, session):
+        """Load the catalog from the database."""
+        rows = session.execute(
+            select(*CATALOG_COLUMNS).order_by(Title.id)
+        ).all()
+        return cls(rows)
+
+    def __len__(self):
+        return len(self.rows)
@@ -9,17 +9,73 @@ This module implements a content-based recommendation algorithm that considers:
 """
 
 import sys
+import time
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import AbstractSet, FrozenSet, List, Dict, Optional, Tuple
 import random
 
+import numpy as np
+
 from src.database.queries import DatabaseQueries
 from src.database.models import Profile, Title
+from src.database.cache import get_data_version
+from src.recommendation.age import age_ratings_for
+from src.recommendation.catalog import TitleCatalog
+
+# Seconds the in-memory catalog is used before being reloaded. The data
+# version only changes when this process rebuilds the database, so this
+# also picks up rebuilds made by another process.
+CATALOG_TTL = 300
+
+# Recency is scored by age in years relative to the case study's current year
+CURRENT_YEAR = 2026
+RECENCY_FIRST_YEAR = 1900
+
+
+def _recency_for_age(age: int) -> float:
+    """Score a title's age in years (prefer recent content)."""
+    if age <= 1:
+        return 10.0  # Very recent
+    elif age <= 3:
+        return 8.0   # Recent
+    elif age <= 5:
+        return 6.0   # Fairly recent
+    elif age <= 10:
+        return 4.0   # Older
+    else:
+        return 2.0   # Classic/old
+
+
+# Recency score per release year, RECENCY_FIRST_YEAR to CURRENT_YEAR + 1.
+# Years outside the table score the same as its first/last entry.
+RECENCY_SCORES = np.array([
+    _recency_for_age(CURRENT_YEAR - year)
+    for year in range(RECENCY_FIRST_YEAR, CURRENT_YEAR + 2)
+])
+
+
+def recency_scores(years):
+    """Look up the recency score of each release year in an array."""
+    positions = np.clip(years, RECENCY_FIRST_YEAR, CURRENT_YEAR + 1) - RECENCY_FIRST_YEAR
+    return RECENCY_SCORES[positions]
+
+
+@lru_cache(maxsize=1024)
+def parse_preferences(preferences: str) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """
+    Split a profile's comma-separated preferences, once per distinct string.
+
+    Returns:
+        Tuple of (set of preference names, lower-cased names)
+    """
+    names = [p.strip() for p in preferences.split(',')]
+    return frozenset(names), tuple(name.lower() for name in names)
 
 
 class RecommendationEngine:
@@ -52,11 +108,15 @@ class RecommendationEngine:
             'popularity': 1.5
         }
 
+        # (data version, load time, catalog, weighted profile-independent scores)
+        self._catalog_state = None
+
     def get_recommendations(
         self, 
         profile_id: int, 
         limit: int = 10,
-        exclude_show_ids: Optional[List[str]] = None
+        exclude_show_ids: Optional[AbstractSet[str]] = None,
+        category: Optional[str] = None
     ) -> List[Dict]:
         """
         Get personalized recommendations for a profile.
@@ -64,7 +124,8 @@ class RecommendationEngine:
         Args:
             profile_id: Profile ID to get recommendations for
             limit: Number of recommendations to return
-            exclude_show_ids: List of show IDs to exclude (already watched)
+            exclude_show_ids: Set (or list) of show IDs to exclude (already watched)
+            category: Only recommend titles in this category
 
         Returns:
             List of recommended titles with scores
@@ -74,114 +135,181 @@ class RecommendationEngine:
         if not profile:
             return []
 
+        catalog, static_scores = self._get_catalog()
+
         # Get candidate titles (age-appropriate)
-        candidates = self._get_candidate_titles(profile)
+        candidates = self._get_candidate_mask(catalog, profile)
+
+        # Restrict to one category
+        if category is not None:
+            in_category = np.array(
+                [example.category == category for example in catalog.genre_examples],
+                dtype=bool
+            )
+            candidates &= in_category[catalog.genre_codes]
 
         # Exclude already watched
         if exclude_show_ids:
-            candidates = [t for t in candidates if t.show_id not in exclude_show_ids]
-
-        # Score each candidate
-        scored_titles = []
-        for title in candidates:
-            score = self._calculate_score(title, profile)
-            scored_titles.append({
-                'title': title,
-                'score': score,
-                'show_id': title.show_id,
-                'title_name': title.title_name,
-                'category': title.category,
-                'year': title.year,
-                'imdb_rating': title.imdb_rating,
-                'age_rating': title.age_rating,
-                'type': title.type,
-                'language': title.language,
-                'duration': title.duration
-            })
-
-        # Sort by score (descending)
-        scored_titles.sort(key=lambda x: x['score'], reverse=True)
-
-        # Return top N
-        return scored_titles[:limit]
-
-    def _get_candidate_titles(self, profile: Profile) -> List[Title]:
+            for show_id in exclude_show_ids:
+                index = catalog.index_by_show_id.get(show_id)
+                if index is not None:
+                    candidates[index] = False
+
+        # Score all titles at once, then rank the candidates
+        candidate_indices = np.flatnonzero(candidates)
+        scores = self._calculate_scores(catalog, static_scores, profile)
+        ranked = self._rank_scores(scores[candidate_indices], limit)
+
+        top_rows = [catalog.rows[candidate_indices[i]] for i, _ in ranked]
+        titles_by_id = self._get_titles_by_id([row.id for row in top_rows])
+
+        return [{
+            'title': titles_by_id.get(row.id),
+            'score': score,
+            'show_id': row.show_id,
+            'title_name': row.title_name,
+            'category': row.category,
+            'year': row.year,
+            'imdb_rating': row.imdb_rating,
+            'age_rating': row.age_rating,
+            'type': row.type,
+            'language': row.language,
+            'duration': row.duration
+        } for row, (_, score) in zip(top_rows, ranked)]
+
+    def _get_catalog(self) -> Tuple[TitleCatalog, Tuple[np.ndarray, ...]]:
         """
-        Get age-appropriate candidate titles for a profile.
-
-        Args:
-            profile: User profile
+        Get the in-memory title catalog, loading it again if the data changed
+        or it is older than CATALOG_TTL.
 
         Returns:
-            List of candidate titles
+            Tuple of (catalog, weighted rating/recency/popularity scores)
         """
-        # Get appropriate age ratings
-        age_ratings = self._get_age_ratings(profile)
+        state = self._catalog_state
+        if (
+            state is None
+            or state[0] != get_data_version()
+            or time.monotonic() - state[1] >= CATALOG_TTL
+        ):
+            version = get_data_version()
+            loaded_at = time.monotonic()
+            session = self.db.get_session()
+            try:
+                catalog = TitleCatalog.load(session)
+            finally:
+                session.close()
+
+            # Profile-independent score components, computed once per load
+            static_scores = (
+                np.array(
+                    [self._score_imdb_rating(row) for row in catalog.rows], dtype=np.float64
+                ) * self.weights['imdb_rating'],
+                recency_scores(catalog.years) * self.weights['recency'],
+                np.array(
+                    [self._score_popularity(row) for row in catalog.rows], dtype=np.float64
+                ) * self.weights['popularity']
+            )
+
+            state = self._catalog_state = (version, loaded_at, catalog, static_scores)
+
+        return state[2], state[3]
+
+    def _get_titles_by_id(self, ids: List[int]) -> Dict[int, Title]:
+        """Fetch Title objects for the given primary keys."""
+        if not ids:
+            return {}
 
-        # Get all titles from database
         session = self.db.get_session()
         try:
-            query = session.query(Title)
-
-            # Filter by kids content
-            if profile.kids_profile:
-                query = query.filter(Title.is_kids_content == True)
-
-            # Filter by age rating
-            query = query.filter(Title.age_rating.in_(age_ratings))
-
-            return query.all()
+            titles = session.query(Title).filter(Title.id.in_(ids)).all()
+            return {title.id: title for title in titles}
         finally:
             session.close()
 
-    def _get_age_ratings(self, profile: Profile) -> List[str]:
-        """Get appropriate age ratings for a profile."""
-        if profile.kids_profile:
-            if profile.age_band == '<13':
-                return ['G', 'PG']
-            elif profile.age_band == '13-17':
-                return ['G', 'PG', '13+']
-
-        # Adult profiles
-        if profile.age_band in ['18-24', '25-34', '35-49', '50+']:
-            return ['G', 'PG', '13+', '16+', '18+']
-
-        return ['G', 'PG', '13+']
-
-    def _calculate_score(self, title: Title, profile: Profile) -> float:
+    def _get_candidate_mask(self, catalog: TitleCatalog, profile: Profile) -> np.ndarray:
         """
-        Calculate recommendation score for a title.
+        Get age-appropriate candidate titles for a profile.
 
         Args:
-            title: Title to score
+            catalog: Title catalog
             profile: User profile
 
         Returns:
-            Recommendation score (0-100)
+            Boolean mask over the catalog rows
+        """
+        # Filter by age rating
+        age_ratings = age_ratings_for(profile)
+        allowed = np.array(
+            [rating in age_ratings for rating in catalog.age_rating_values],
+            dtype=bool
+        )
+        candidates = allowed[catalog.age_rating_codes]
+
+        # Filter by kids content
+        if profile.kids_profile:
+            candidates &= catalog.is_kids_content
+
+        return candidates
+
+    def _calculate_scores(
+        self,
+        catalog: TitleCatalog,
+        static_scores: Tuple[np.ndarray, ...],
+        profile: Profile
+    ) -> np.ndarray:
         """
-        score = 0.0
+        Calculate unrounded recommendation scores for every catalog title.
 
-        # 1. Preference match (0-10 points)
-        preference_score = self._score_preference_match(title, profile)
-        score += preference_score * self.weights['preference_match']
+        Preference and language scores are computed once per distinct
+        category/sub-category pair and language, then gathered per title.
+        Each component is a 0-10 score times its weight; the rating,
+        recency and popularity components are precomputed per catalog load.
 
-        # 2. Language match (0-10 points)
-        language_score = self._score_language_match(title, profile)
-        score += language_score * self.weights['language_match']
+        Returns:
+            Array of scores, aligned with the catalog rows
+        """
+        preference_scores = np.array([
+            self._score_preference_match(example, profile)
+            for example in catalog.genre_examples
+        ])[catalog.genre_codes]
+        language_scores = np.array([
+            self._score_language_match(example, profile)
+            for example in catalog.language_examples
+        ])[catalog.language_codes]
+        rating_scores, recency_scores, popularity_scores = static_scores
+
+        scores = preference_scores * self.weights['preference_match']
+        scores += language_scores * self.weights['language_match']
+        scores += rating_scores
+        scores += recency_scores
+        scores += popularity_scores
+        return scores
+
+    @staticmethod
+    def _rank_scores(scores: np.ndarray, limit: int) -> List[Tuple[int, float]]:
+        """
+        Pick the top scores, ranked by score rounded to 2 decimals.
 
-        # 3. IMDB rating (0-10 points)
-        rating_score = self._score_imdb_rating(title)
-        score += rating_score * self.weights['imdb_rating']
+        Ties keep catalog order. np.round may differ from round() by one
+        step, so it is only used to discard titles well below the cut-off;
+        the rest are rounded and sorted in Python.
 
-        # 4. Recency (0-10 points)
-        recency_score = self._score_recency(title)
-        score += recency_score * self.weights['recency']
+        Args:
+            scores: Unrounded scores
+            limit: Number of scores to return
 
-        # 5. Popularity (0-10 points)
-        popularity_score = self._score_popularity(title)
-        score += popularity_score * self.weights['popularity']
+        Returns:
+            List of (position in scores, rounded score) pairs
+        """
+        positions = range(len(scores))
+        if 0 < limit < len(scores):
+            approx = np.round(scores, 2)
+            cutoff = np.partition(approx, len(approx) - limit)[len(approx) - limit]
+            positions = np.flatnonzero(approx >= cutoff - 0.025)
 
-        return round(score, 2)
+        ranked = [(int(i), round(float(scores[i]), 2)) for i in positions]
+        ranked.sort(key=lambda x: x[1], reverse=True)
+        return ranked[:limit]
 
     def _score_preference_match(self, title: Title, profile: Profile) -> float:
         """
@@ -194,7 +322,7 @@ class RecommendationEngine:
             return 5.0  # Neutral score if no preferences
 
         # Parse preferences
-        preferences = [p.strip() for p in profile.preferences.split(',')]
+        preferences, preferences_lower = parse_preferences(profile.preferences)
 
         # Check if title category matches any preference
         if title.category in preferences:
@@ -206,8 +334,8 @@ class RecommendationEngine:
 
         # Partial match (case-insensitive)
         title_cat_lower = title.category.lower()
-        for pref in preferences:
-            if pref.lower() in title_cat_lower or title_cat_lower in pref.lower():
+        for pref in preferences_lower:
+            if pref in title_cat_lower or title_cat_lower in pref:
                 return 6.0
 
         return 3.0  # No match
@@ -246,30 +374,6 @@ class RecommendationEngine:
         # IMDB ratings typically range from 1-10
         return title.imdb_rating
 
-    def _score_recency(self, title: Title) -> float:
-        """
-        Score based on release year (prefer recent content).
-
-        Returns:
-            Score 0-10
-        """
-        current_year = 2026  # As per case study context
-
-        # Calculate age of content
-        age = current_year - title.year
-
-        # Score based on age
-        if age <= 1:
-            return 10.0  # Very recent
-        elif age <= 3:
-            return 8.0   # Recent
-        elif age <= 5:
-            return 6.0   # Fairly recent
-        elif age <= 10:
-            return 4.0   # Older
-        else:
-            return 2.0   # Classic/old
-
     def _score_popularity(self, title: Title) -> float:
         """
         Score based on IMDB votes (popularity indicator).
@@ -277,18 +381,11 @@ class RecommendationEngine:
         Returns:
             Score 0-10
         """
-        if not title.has_imdb_data or title.imdb_votes is None:
+        if title.popularity_score is None:
             return 5.0  # Neutral for no data
 
-        # Logarithmic scale for votes
-        # 10 votes = 0, 100 votes = 3.3, 1000 votes = 6.6, 10000+ votes = 10
-        import math
-
-        if title.imdb_votes < 10:
-            return 0.0
-
-        score = (math.log10(title.imdb_votes) - 1) * 3.33
-        return min(10.0, max(0.0, score))
+        # Log-scaled votes, precomputed when the data is loaded
+        return title.popularity_score
 
     def get_recommendations_by_category(
         self,
@@ -307,13 +404,7 @@ class RecommendationEngine:
         Returns:
             List of recommended titles
         """
-        # Get all recommendations
-        all_recs = self.get_recommendations(profile_id, limit=100)
-
-        # Filter by category
-        filtered = [r for r in all_recs if r['category'] == category]
-
-        return filtered[:limit]
+        return self.get_recommendations(profile_id, limit=limit, category=category)
 
     def get_similar_titles(
         self,
@@ -330,65 +421,78 @@ class RecommendationEngine:
         Returns:
             List of similar titles
         """
-        # Get the reference title
-        title = self.db.get_title_by_show_id(show_id)
-        if not title:
+        # Get the reference title and the other titles in its category
+        # from the in-memory catalog
+        catalog, _ = self._get_catalog()
+        position = catalog.index_by_show_id.get(show_id)
+        if position is None:
             return []
 
-        # Get all titles in same category
-        session = self.db.get_session()
-        try:
-            candidates = session.query(Title).filter(
-                Title.category == title.category,
-                Title.show_id != show_id  # Exclude the reference title
-            ).all()
-
-            # Score based on similarity
-            scored = []
-            for candidate in candidates:
-                similarity_score = self._calculate_similarity(title, candidate)
-                scored.append({
-                    'title': candidate,
-                    'score': similarity_score,
-                    'show_id': candidate.show_id,
-                    'title_name': candidate.title_name,
-                    'category': candidate.category,
-                    'year': candidate.year,
-                    'imdb_rating': candidate.imdb_rating
-                })
-
-            # Sort by similarity
-            scored.sort(key=lambda x: x['score'], reverse=True)
-
-            return scored[:limit]
-        finally:
-            session.close()
+        title = catalog.rows[position]
+        candidates = catalog.positions_by_category[title.category]
+        candidates = candidates[candidates != position]  # Exclude the reference title
+
+        # Score based on similarity, then sort by it (stable, so ties are
+        # ranked by id, as in _rank_scores)
+        scores = self._calculate_similarities(catalog, position, candidates)
+        order = np.argsort(-scores, kind='stable')[:limit]
+        scored = [(float(scores[i]), catalog.rows[candidates[i]]) for i in order]
+
+        # Only the returned titles are loaded as Title objects
+        titles_by_id = self._get_titles_by_id([candidate.id for _, candidate in scored])
+
+        return [{
+            'title': titles_by_id.get(candidate.id),
+            'score': similarity_score,
+            'show_id': candidate.show_id,
+            'title_name': candidate.title_name,
+            'category': candidate.category,
+            'year': candidate.year,
+            'imdb_rating': candidate.imdb_rating
+        } for similarity_score, candidate in scored]
+
+    @staticmethod
+    def _calculate_similarities(
+        catalog: TitleCatalog,
+        position: int,
+        candidates: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate similarity scores between a title and candidate titles.
 
-    def _calculate_similarity(self, title1: Title, title2: Title) -> float:
-        """Calculate similarity score between two titles."""
-        score = 0.0
+        Args:
+            catalog: Title catalog
+            position: Catalog row of the reference title
+            candidates: Catalog rows of the candidates (same category)
 
+        Returns:
+            Array of scores, aligned with candidates
+        """
         # Same category (already filtered)
-        score += 10.0
+        score = np.full(len(candidates), 10.0)
 
-        # Same sub-category
-        if title1.sub_category == title2.sub_category:
-            score += 10.0
+        # Same sub-category (genre codes are category/sub-category pairs)
+        score += np.where(
+            catalog.genre_codes[candidates] == catalog.genre_codes[position], 10.0, 0.0
+        )
 
         # Same type (Movie/Series)
-        if title1.type == title2.type:
-            score += 5.0
+        score += np.where(
+            catalog.type_codes[candidates] == catalog.type_codes[position], 5.0, 0.0
+        )
 
         # Similar year (within 5 years)
-        year_diff = abs(title1.year - title2.year)
-        if year_diff <= 5:
-            score += (5 - year_diff) * 2
-
-        # Similar rating
-        if title1.imdb_rating and title2.imdb_rating:
-            rating_diff = abs(title1.imdb_rating - title2.imdb_rating)
-            if rating_diff <= 1.0:
-                score += (1.0 - rating_diff) * 10
+        year_diff = np.abs(catalog.years[candidates] - catalog.years[position])
+        score += np.where(year_diff <= 5, (5 - year_diff) * 2, 0)
+
+        # Similar rating (unrated and 0.0 ratings don't count)
+        reference_rating = catalog.imdb_ratings[position]
+        if reference_rating and not np.isnan(reference_rating):
+            ratings = catalog.imdb_ratings[candidates]
+            rating_diff = np.abs(ratings - reference_rating)
+            score += np.where(
+                (ratings != 0.0) & (rating_diff <= 1.0), (1.0 - rating_diff) * 10, 0.0
+            )
 
         return score
 
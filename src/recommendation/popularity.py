@@ -0,0 +1,25 @@
+"""
+Popularity Scoring for Streamly Recommendation System
+
+This module scores how popular a title is from its IMDB votes. Scores are
+computed once when the data is loaded and read back by the recommendation
+engine.
+"""
+
+import math
+
+
+def popularity_score(imdb_votes):
+    """
+    Score a title's IMDB votes on a logarithmic 0-10 scale.
+
+    10 votes = 0, 100 votes = 3.3, 1000 votes = 6.6, 10000+ votes = 10.
+    Titles without votes get None.
+    """
+    if imdb_votes is None or math.isnan(imdb_votes):
+        return None
+    if imdb_votes < 10:
+        return 0.0
+
+    score = (math.log10(imdb_votes) - 1) * 3.33
+    return min(10.0, max(0.0, score))
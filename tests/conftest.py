@@ -0,0 +1,104 @@
+"""
+Shared test fixtures for Streamly Recommendation System
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.database.db_setup import DatabaseManager
+from src.database.models import Base, Account, Profile, Title
+
+# (show_id, title_name, category, type, year, imdb_rating, imdb_votes, kids)
+TITLES = [
+    ('t1', 'Night Moves', 'Drama', 'Movie', 2020, 7.5, 1200.0, False),
+    ('t2', 'Nightcrawler', 'Drama', 'Movie', 2014, 7.8, 500000.0, False),
+    ('t3', 'Midnight Run', 'Comedy', 'Movie', 1988, 7.5, 90000.0, False),
+    ('t4', 'The Night Of', 'Drama', 'Series', 2016, 8.5, 200000.0, False),
+    ('t5', 'Paddington', 'Comedy', 'Movie', 2014, 7.3, 80000.0, True),
+]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """
+    Small database: account 1 has one profile, account 2 has three, plus a
+    few titles with their search index.
+    """
+    path = tmp_path / 'streamly.db'
+    engine = create_engine(f'sqlite:///{path}')
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        for account_id, profile_count in ((1, 1), (2, 3)):
+            session.add(Account(
+                account_id=account_id,
+                created_at=date(2024, 1, 1),
+                primary_language='en',
+                profile_count=profile_count,
+                account_age_days=365
+            ))
+            for n in range(profile_count):
+                session.add(Profile(
+                    account_id=account_id,
+                    profile_name=f'Profile {account_id}-{n}',
+                    kids_profile=False,
+                    age_band='25-34',
+                    age_band_order=3,
+                    preferred_language='en',
+                    created_at=date(2024, 1, 1),
+                    preferences='Drama, Comedy',
+                    preference_count=2,
+                    account_age_days=365
+                ))
+        for show_id, name, category, content_type, year, rating, votes, kids in TITLES:
+            session.add(Title(
+                show_id=show_id,
+                title_name=name,
+                category=category,
+                sub_category=category,
+                duration=100 if content_type == 'Movie' else 60,
+                age_rating='PG' if kids else '13+',
+                type=content_type,
+                year=year,
+                origin_region='US',
+                language='en',
+                episode_count=1 if content_type == 'Movie' else 8,
+                is_kids_content=kids,
+                imdb_rating=rating,
+                imdb_votes=votes,
+                has_imdb_data=True,
+                data_completeness_score=1.0
+            ))
+        session.commit()
+
+    engine.dispose()
+
+    manager = DatabaseManager(path)
+    manager.create_engine_and_session()
+    manager.create_search_index()
+    manager.engine.dispose()
+    return path
+
+
+@pytest.fixture
+def count_queries():
+    """Count the SQL statements an engine executes."""
+    def counter(engine):
+        executed = []
+
+        @event.listens_for(engine, 'before_cursor_execute')
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            executed.append(statement)
+
+        return executed
+
+    return counter
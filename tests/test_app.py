@@ -0,0 +1,91 @@
+"""
+Tests for the Flask API endpoints
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.api import app as app_module
+from src.database import cache
+from src.database.cache import TTLCache
+from src.database.models import Title
+from src.database.queries import DatabaseQueries
+from src.recommendation.engine import RecommendationEngine
+
+
+@pytest.fixture
+def client(db_path, monkeypatch):
+    """Test client serving the test database, with empty caches."""
+    monkeypatch.setattr(app_module, '_db_queries', DatabaseQueries(db_path))
+    monkeypatch.setattr(app_module, '_recommendation_engine', RecommendationEngine(db_path))
+    monkeypatch.setattr(app_module, '_TITLE_DICTS', {'value': None, 'ts': 0, 'version': None})
+    monkeypatch.setattr(app_module, '_TITLES_TOTAL', {'value': None, 'ts': 0, 'version': None})
+    monkeypatch.setattr(app_module, '_RECOMMENDATIONS_CACHE', TTLCache())
+    monkeypatch.setattr(app_module, '_CATEGORIES_CACHE', None)
+    return app_module.app.test_client()
+
+
+def add_title(db_path, show_id, title_name, category='Drama'):
+    """Insert a title behind the app's back (as another process would)."""
+    engine = create_engine(f'sqlite:///{db_path}')
+    with Session(engine) as session:
+        session.add(Title(
+            show_id=show_id, title_name=title_name, category=category,
+            sub_category=category, duration=90, age_rating='PG', type='Movie',
+            year=2024, origin_region='US', language='en', episode_count=1,
+            is_kids_content=False, has_imdb_data=False, data_completeness_score=0.8
+        ))
+        session.commit()
+    engine.dispose()
+
+
+def test_titles_page_includes_titles_added_after_caching(client, db_path):
+    params = {'sort_by': 'title_name', 'order': 'asc'}
+    assert client.get('/api/titles', query_string=params).status_code == 200
+
+    add_title(db_path, 't99', 'Aardvark')
+
+    response = client.get('/api/titles', query_string=params)
+    assert response.status_code == 200
+    assert response.get_json()['data'][0]['show_id'] == 't99'
+
+    response = client.get('/api/titles', query_string={**params, 'after_id': 't99'})
+    assert response.status_code == 200
+    assert response.get_json()['data'][0]['title_name'] == 'Midnight Run'
+
+
+def test_recommendations_endpoint_uses_constant_queries(client, count_queries):
+    assert client.get('/api/recommendations/1').status_code == 200
+    executed = count_queries(app_module.get_db_queries().engine)
+
+    query_counts = []
+    for profile_id in (2, 3, 4):
+        executed.clear()
+        response = client.get(f'/api/recommendations/{profile_id}', query_string={'limit': 3})
+        assert response.get_json()['count'] == 3
+        query_counts.append(len(executed))
+
+    assert query_counts == [2, 2, 2]
+
+    # Repeated requests are served from the cache
+    executed.clear()
+    client.get('/api/recommendations/2', query_string={'limit': 3})
+    assert executed == []
+
+
+def test_categories_rebuild_replaces_the_snapshot(client, db_path, monkeypatch):
+    assert client.get('/api/categories').get_json()['data'] == ['Comedy', 'Drama']
+    old = app_module._get_categories_cache()
+
+    add_title(db_path, 't99', 'Aardvark', category='Horror')
+    monkeypatch.setattr(cache, 'DATA_VERSION', cache.DATA_VERSION + 1)
+
+    response = client.get('/api/categories')
+    new = app_module._get_categories_cache()
+    assert response.get_json()['data'] == ['Comedy', 'Drama', 'Horror']
+    assert response.get_etag()[0] == new['etag']
+    # A reader still holding the old snapshot keeps its matching body and ETag
+    assert new is not old
+    assert old['value'] == ('Comedy', 'Drama')
+    assert old['etag'] == app_module.compute_etag(old['body'])
@@ -0,0 +1,80 @@
+"""
+Tests for reading, cleaning and saving data files in DataCleaner
+"""
+
+import pandas as pd
+
+from src.data_processing import data_cleaner
+from src.data_processing.data_cleaner import DataCleaner
+
+TITLES_CSV = (
+    "show_id,title_name,category,sub_category,duration,age_rating,type,year,"
+    "origin_region,language,episode_count,is_kids_content,imdb_rating,imdb_votes\n"
+) + """\
+t1,One,Drama,,90,PG,Movie,2000,US,en,1,False,7.0,100.0
+t2,Two,Drama,,,PG,Movie,2010,US,en,1,True,,
+t3,Three,Comedy,,110,13+,Movie,,US,en,,,6.0,50.0
+t4,Four,Comedy,,45,PG,Series,2020,US,en,8,False,,
+"""
+
+PROFILES_CSV = (
+    "profile_id,account_id,profile_name,kids_profile,age_band,"
+    "preferred_language,created_at,preferences\n"
+) + """\
+1,1,Ann,False,25-34,English,2022-10-21,"Drama, Comedy"
+2,,Bob,False,25-34,English,2022-10-21,Drama
+3,2,Kid,,<13,English,2023-01-02,Comedy
+"""
+
+
+def load_cleaner(tmp_path, monkeypatch):
+    """Load the test CSVs through DataCleaner.load_data."""
+    (tmp_path / 'titles.csv').write_text(TITLES_CSV)
+    (tmp_path / 'profiles.csv').write_text(PROFILES_CSV)
+    monkeypatch.setattr(data_cleaner, 'RAW_DATA_DIR', tmp_path)
+
+    cleaner = DataCleaner()
+    assert cleaner.load_data()
+    return cleaner
+
+
+def test_missing_year_and_duration_are_filled(tmp_path, monkeypatch):
+    cleaner = load_cleaner(tmp_path, monkeypatch)
+    cleaner.analyze_data_quality()
+    cleaner.clean_titles()
+    titles = cleaner.titles_df.set_index('show_id')
+
+    # Median of the other movies' durations, median year of all titles
+    assert titles.loc['t2', 'duration'] == 100
+    assert titles.loc['t3', 'year'] == 2010
+    assert titles.loc['t3', 'episode_count'] == 1
+    assert not titles.loc['t3', 'is_kids_content']
+
+    assert titles['duration'].dtype == 'int32'
+    assert titles['year'].dtype == 'int16'
+    assert titles['episode_count'].dtype == 'int32'
+    assert titles['is_kids_content'].dtype == bool
+
+
+def test_profiles_without_ids_are_dropped(tmp_path, monkeypatch):
+    cleaner = load_cleaner(tmp_path, monkeypatch)
+    cleaner.clean_profiles()
+    profiles = cleaner.profiles_df
+
+    assert profiles['profile_id'].tolist() == [1, 3]
+    assert profiles['account_id'].dtype == 'int32'
+    assert profiles['kids_profile'].tolist() == [False, False]
+    assert profiles['kids_profile'].dtype == bool
+
+
+def test_save_writes_csv_and_removes_stale_parquet(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_cleaner, 'PARQUET_AVAILABLE', False)
+    csv_path = tmp_path / 'titles_cleaned.csv'
+    stale_parquet = tmp_path / 'titles_cleaned.parquet'
+    stale_parquet.write_bytes(b'left by an earlier run')
+
+    df = pd.DataFrame({'show_id': ['t1'], 'year': [2000]})
+    assert DataCleaner().save_cleaned_file(df, csv_path) == [csv_path]
+
+    assert pd.read_csv(csv_path).equals(df)
+    assert not stale_parquet.exists()
@@ -0,0 +1,41 @@
+"""
+Tests for DatabaseManager
+"""
+
+import sqlite3
+
+import pytest
+
+from src.database.db_setup import DatabaseManager
+from src.database.queries import DatabaseQueries
+from src.recommendation.popularity import popularity_score
+
+
+@pytest.fixture
+def old_db_path(db_path):
+    """The test database as built before titles.popularity_score existed."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute('ALTER TABLE titles DROP COLUMN popularity_score')
+    return db_path
+
+
+def title_columns(path):
+    with sqlite3.connect(path) as conn:
+        return {row[1] for row in conn.execute('PRAGMA table_info(titles)')}
+
+
+def test_reading_does_not_change_the_schema(old_db_path):
+    DatabaseQueries(old_db_path).engine.connect().close()
+
+    assert 'popularity_score' not in title_columns(old_db_path)
+
+
+def test_upgrade_database_adds_and_fills_popularity_score(old_db_path):
+    manager = DatabaseManager(old_db_path)
+    manager.upgrade_database()
+    manager.engine.dispose()
+
+    assert 'popularity_score' in title_columns(old_db_path)
+    with sqlite3.connect(old_db_path) as conn:
+        rows = conn.execute('SELECT imdb_votes, popularity_score FROM titles').fetchall()
+    assert all(score == popularity_score(votes) for votes, score in rows)
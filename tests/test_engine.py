@@ -0,0 +1,22 @@
+"""
+Tests for the recommendation engine
+"""
+
+from src.recommendation.engine import RecommendationEngine
+
+
+def test_recommendations_use_constant_queries(db_path, count_queries):
+    engine = RecommendationEngine(db_path)
+    # The first call also loads the title catalog
+    engine.get_recommendations(1, limit=3)
+    executed = count_queries(engine.db.engine)
+
+    query_counts = []
+    for profile_id in (1, 2, 3):
+        executed.clear()
+        recommendations = engine.get_recommendations(profile_id, limit=3)
+        assert len(recommendations) == 3
+        query_counts.append(len(executed))
+
+    # One query for the profile, one for the returned titles
+    assert query_counts == [2, 2, 2]
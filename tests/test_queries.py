@@ -0,0 +1,77 @@
+"""
+Tests for DatabaseQueries
+"""
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from src.database import queries
+from src.database.models import Profile
+from src.database.queries import DatabaseQueries
+
+
+def test_profiles_with_accounts_use_constant_queries(db_path, count_queries):
+    db = DatabaseQueries(db_path)
+    executed = count_queries(db.engine)
+
+    query_counts = []
+    for account_id in (1, 2):
+        executed.clear()
+        profiles = db.get_profiles_by_account(account_id, load_account=True)
+        # Accounts were loaded eagerly, so this issues no further queries
+        assert all(profile.account.account_id == account_id for profile in profiles)
+        query_counts.append(len(executed))
+
+    # One query for the profiles, one for their accounts
+    assert query_counts == [2, 2]
+
+
+def test_debug_n_plus_1_raises_on_lazy_load(db_path, monkeypatch):
+    monkeypatch.setattr(queries, 'DEBUG_N_PLUS_1', True)
+    db = DatabaseQueries(db_path)
+
+    with db.session_scope() as session:
+        profile = session.query(Profile).first()
+        with pytest.raises(InvalidRequestError):
+            profile.account
+
+    # Eagerly loaded relationships are still available
+    profile = db.get_profile_by_id(1, load_account=True)
+    assert profile.account.account_id == 1
+
+
+def test_lazy_load_allowed_without_debug_switch(db_path, monkeypatch):
+    monkeypatch.setattr(queries, 'DEBUG_N_PLUS_1', False)
+    db = DatabaseQueries(db_path)
+
+    with db.session_scope() as session:
+        profile = session.query(Profile).first()
+        assert profile.account.account_id == 1
+
+
+def test_search_matches_word_prefixes_then_substrings(db_path):
+    db = DatabaseQueries(db_path)
+
+    names = [title.title_name for title in db.search_titles('night')]
+    # Word-prefix matches from the search index first, then titles that
+    # only contain the term ('Midnight')
+    assert sorted(names[:3]) == ['Night Moves', 'Nightcrawler', 'The Night Of']
+    assert names[3:] == ['Midnight Run']
+
+    assert len(db.search_titles('night', limit=2)) == 2
+    assert [title.title_name for title in db.search_titles('night mo')] == ['Night Moves']
+
+
+def test_title_lookups_cache_data_not_objects(db_path, count_queries):
+    db = DatabaseQueries(db_path)
+    first = db.get_titles_by_category('Drama')
+    first[0].title_name = 'Changed by one caller'
+
+    executed = count_queries(db.engine)
+    second = db.get_titles_by_category('Drama')
+
+    assert executed == []
+    assert first[0] is not second[0]
+    assert sorted(title.show_id for title in second) == ['t1', 't2', 't4']
+    assert 'Changed by one caller' not in {title.title_name for title in second}
+    assert second[0].to_dict()['category'] == 'Drama'